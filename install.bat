@@ -51,6 +51,9 @@ if errorlevel 1 (
 echo Upgrading pip and installing requirements...
 call venv\Scripts\activate.bat && (
     python -m pip install --upgrade pip
+    :: pygame and pygame-ce share the pygame package directory, so drop both
+    :: if pygame is installed and let requirements.txt install pygame-ce cleanly
+    pip show pygame >nul 2>&1 && pip uninstall -y pygame pygame-ce
     if exist "requirements.txt" (
         pip install -r requirements.txt
         if errorlevel 1 (
@@ -40,6 +40,13 @@ source venv/bin/activate
 echo "⬆️ Upgrading pip..."
 pip install --upgrade pip
 
+# pygame and pygame-ce share the pygame package directory, so an older venv with
+# pygame installed must drop both before pygame-ce is installed cleanly
+if pip show pygame &> /dev/null; then
+    echo "🔁 Replacing pygame with pygame-ce..."
+    pip uninstall -y pygame pygame-ce
+fi
+
 # Install all Python dependencies from requirements.txt
 echo "📚 Installing Python libraries..."
 pip install -r requirements.txt
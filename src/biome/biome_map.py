@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from typing import List, Tuple, Optional, Dict, Set
 from dataclasses import dataclass
 from .biome import Biome
@@ -34,6 +35,8 @@ class BiomeMap:
     - Managing resource filters and noise map selection
     """
     
+    _BLOCK_SIZE = 32
+    
     def __init__(self, biomes: List[Biome]) -> None:
         """Initialize the biome map.
         
@@ -41,7 +44,7 @@ class BiomeMap:
             biomes: List of Biome objects to use for generation
         """
         self._biomes = biomes
-        self._config = Config()
+        self._config = Config.instance()
         self._style = StyleManager.get_instance().get_style()
         
         # Initialize dimensions
@@ -150,20 +153,86 @@ class BiomeMap:
         
         return best_match if best_score >= 0.5 else None
 
+    def _get_biome_ranges(self) -> np.ndarray:
+        """Get the property ranges of all biomes as an array.
+        
+        Returns:
+            np.ndarray: Array of shape (biomes, 4, 2) holding the (min, max) range
+                of height, humidity, temperature and mystical for each biome
+        """
+        return np.array([
+            (biome._properties.height, biome._properties.humidity,
+             biome._properties.temperature, biome._properties.mystical)
+            for biome in self._biomes
+        ], dtype=np.float64).reshape(len(self._biomes), 4, 2)
+
+    def _classify_block(self, values: np.ndarray, ranges: np.ndarray) -> np.ndarray:
+        """Find the best matching biome index for every cell of a block.
+        
+        Applies the same scoring as _find_matching_biome: the first biome with the
+        most matching properties wins, provided at least half of them match.
+        
+        Args:
+            values: Noise values of shape (4, rows, cols)
+            ranges: Biome ranges as returned by _get_biome_ranges
+            
+        Returns:
+            np.ndarray: Biome indices of shape (rows, cols), -1 where nothing matches
+        """
+        # Without biomes nothing can match, and argmax needs at least one score
+        if not len(ranges):
+            return np.full(values.shape[1:], -1, dtype=np.int16)
+        lows = ranges[:, :, 0, None, None]
+        highs = ranges[:, :, 1, None, None]
+        scores = ((lows <= values) & (values <= highs)).sum(axis=1)
+        best = scores.argmax(axis=0)
+        best_score = np.take_along_axis(scores, best[None], axis=0)[0]
+        return np.where(best_score >= 2, best, -1)
+
     def _generate_biome_grid(self) -> None:
-        """Generate the biome grid using noise maps."""
-        for y in range(self._dimensions.grid_height):
-            for x in range(self._dimensions.grid_width):
-                height = self._noise_maps["Height"].get(x, y)
-                humidity = self._noise_maps["Humidity"].get(x, y)
-                temperature = self._noise_maps["Temperature"].get(x, y)
-                mystical = self._noise_maps["Mystical"].get(x, y)
+        """Generate the biome grid using noise maps.
+        
+        The grid is classified in square blocks. When the noise bounds of a block
+        lie entirely inside or entirely outside each biome range, every cell in the
+        block scores the same and the block is assigned in one step; otherwise the
+        block is scored per cell.
+        """
+        block = self._BLOCK_SIZE
+        values = np.stack([
+            self._noise_maps[name].values.T
+            for name in ("Height", "Humidity", "Temperature", "Mystical")
+        ])
+        ranges = self._get_biome_ranges()
+        lows, highs = ranges[:, :, 0], ranges[:, :, 1]
+        indices = np.empty((self._dimensions.grid_height, self._dimensions.grid_width), dtype=np.int16)
+        
+        for y0 in range(0, self._dimensions.grid_height, block):
+            for x0 in range(0, self._dimensions.grid_width, block):
+                block_values = values[:, y0:y0 + block, x0:x0 + block]
+                mins = block_values.min(axis=(1, 2))
+                maxs = block_values.max(axis=(1, 2))
+                inside = (lows <= mins) & (maxs <= highs)
+                outside = (maxs < lows) | (mins > highs)
                 
-                self._grid[y][x] = self._find_matching_biome(
-                    height, humidity, temperature, mystical
-                )
+                if (inside | outside).all():
+                    indices[y0:y0 + block, x0:x0 + block] = self._classify_block(
+                        mins[:, None, None], ranges
+                    )[0, 0]
+                else:
+                    indices[y0:y0 + block, x0:x0 + block] = self._classify_block(
+                        block_values, ranges
+                    )
+        
+        lookup = self._biomes + [None]
+        self._grid = [[lookup[index] for index in row] for row in indices.tolist()]
         
-        self._resource_filter.update_resource_stats(self._grid)
+        # Resource index of each cell in resource filter order, 255 for empty cells
+        resource_lookup = np.array(
+            [self._resource_types.index(biome.resource_type) for biome in self._biomes] + [255],
+            dtype=np.uint8
+        )
+        self._resource_ids = resource_lookup[indices]
+        self._resource_filter.update_resource_stats(self._grid, self._resource_ids)
 
     def update_screen_size(self, width: int, height: int) -> None:
         """Update screen dimensions and recenter the map.
@@ -199,6 +268,19 @@ class BiomeMap:
         self._position.offset_x = (self._dimensions.screen_width - total_width) // 2
         self._position.offset_y = (self._dimensions.screen_height - total_height) // 2
 
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area covered by the map grid.
+        
+        Returns:
+            pygame.Rect: Rect of the drawn grid, which may extend past the screen
+        """
+        return pygame.Rect(
+            self._position.offset_x,
+            self._position.offset_y,
+            self._dimensions.grid_width * self._dimensions.cell_size,
+            self._dimensions.grid_height * self._dimensions.cell_size
+        )
+
     def _get_tile_at_pos(self, pos: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Get grid coordinates for a screen position.
         
@@ -33,9 +33,23 @@ class Config:
     """Main configuration class that manages all game settings.
     
     This class provides a centralized location for all game configuration settings,
-    organized into logical groups using dataclasses.
+    organized into logical groups using dataclasses. Use Config.instance() to get
+    the configuration shared by the whole game.
     """
     
+    _instance: Optional["Config"] = None
+    
+    @classmethod
+    def instance(cls) -> "Config":
+        """Get the shared configuration, creating it on first use.
+        
+        Returns:
+            Config: The process-wide configuration
+        """
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+    
     def __init__(self) -> None:
         """Initialize the configuration with default values."""
         self._map_config = MapConfig()
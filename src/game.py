@@ -1,7 +1,7 @@
 import pygame
 import sys
 from typing import Tuple
-from ui import SceneManager, TitleScreen, OptionsScreen, GameScreen
+from ui import SceneManager, TitleScreen, OptionsScreen, GameScreen, preload_game_map
 from config import Config
 
 class Game:
@@ -27,7 +27,7 @@ class Game:
     def __init__(self) -> None:
         """Initialize the game with default settings and components."""
         pygame.init()
-        self._config = Config()
+        self._config = Config.instance()
         # Use initial window dimensions for startup
         self._screen_width, self._screen_height = self._config.get_initial_window_dimensions()
         self._screen = pygame.display.set_mode((self._screen_width, self._screen_height), pygame.RESIZABLE)
@@ -39,6 +39,8 @@ class Game:
         # Initialize scene manager
         self._scene_manager = SceneManager(self._config)
         self._register_scenes()
+        # Build the game map while the player is on the title screen
+        preload_game_map(self._config)
         self._scene_manager.set_scene("title")
 
     def _register_scenes(self) -> None:
@@ -92,6 +94,9 @@ class Game:
                 self._running = False
             elif event.type == pygame.VIDEORESIZE:
                 self.handle_resize(event.w, event.h)
+            elif event.type == pygame.VIDEOEXPOSE or event.type == pygame.WINDOWEXPOSED:
+                # The window contents were lost, and idle frames present nothing
+                self._scene_manager.force_redraw()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_F11:
                     self.toggle_fullscreen()
@@ -107,7 +112,11 @@ class Game:
     def draw(self) -> None:
         """Draw the current scene."""
         self._scene_manager.draw(self._screen)
-        pygame.display.flip()
+        dirty_rects = self._scene_manager.get_dirty_rects()
+        if dirty_rects is None:
+            pygame.display.flip()
+        elif dirty_rects:
+            pygame.display.update(dirty_rects)
 
     def run(self) -> None:
         """Run the main game loop."""
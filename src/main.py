@@ -66,9 +66,11 @@ def main() -> NoReturn:
         # Setup logging
         setup_logging()
         logging.info("Starting game...")
+        if not getattr(pygame, "IS_CE", False):
+            logging.warning("Running on upstream pygame; install pygame-ce for better rendering performance")
         
         # Initialize configuration
-        config = Config()
+        config = Config.instance()
         if not validate_config(config):
             logging.error("Failed to validate configuration")
             sys.exit(1)
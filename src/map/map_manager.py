@@ -2,6 +2,7 @@ import random
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 import noise
+import numpy as np
 from map.tile import Tile
 from biome.biome import Biome
 
@@ -45,7 +46,9 @@ class MapManager:
         self._height = height
         self._tile_size = tile_size
         self._biomes = biomes
-        self._tiles: List[List[Tile]] = []
+        self._biome_indices = np.zeros((height, width), dtype=np.int16)
+        self._tile_cache: Dict[Tuple[int, int], Tile] = {}
+        self._tiles: Optional[List[List[Tile]]] = None
         
         # Noise parameters
         self._noise_params = NoiseParameters(
@@ -59,11 +62,15 @@ class MapManager:
         self.generate_map()
 
     def generate_map(self) -> None:
-        """Generate the map using noise-based terrain generation."""
-        self._tiles = []
+        """Generate the map using noise-based terrain generation.
+        
+        Only the biome index of each tile is stored; Tile objects are created
+        lazily the first time they are accessed.
+        """
+        self._tile_cache = {}
+        self._tiles = None
         
         for y in range(self._height):
-            row = []
             for x in range(self._width):
                 # Calculate normalized coordinates
                 nx = x / self._width - 0.5
@@ -82,17 +89,28 @@ class MapManager:
                 mystical_val = (mystical_val + 0.5)
                 
                 # Find matching biome
-                biome = self._find_matching_biome(
+                self._biome_indices[y, x] = self._find_matching_biome_index(
                     height_val,
                     humidity_val,
                     temperature_val,
                     mystical_val
                 )
-                
-                # Create tile with selected biome
-                row.append(Tile(x, y, biome))
-                
-            self._tiles.append(row)
+
+    def _get_tile(self, tx: int, ty: int) -> Tile:
+        """Get the tile at the specified grid coordinates, creating it if needed.
+        
+        Args:
+            tx: Grid x coordinate
+            ty: Grid y coordinate
+            
+        Returns:
+            Tile: Tile at the coordinates
+        """
+        tile = self._tile_cache.get((tx, ty))
+        if tile is None:
+            tile = Tile(tx, ty, self._biomes[self._biome_indices[ty, tx]])
+            self._tile_cache[(tx, ty)] = tile
+        return tile
 
     def _generate_noise(self, nx: float, ny: float, base: int) -> float:
         """Generate a noise value for the given coordinates.
@@ -114,8 +132,8 @@ class MapManager:
             base=base
         )
 
-    def _find_matching_biome(self, height: float, humidity: float,
-                           temperature: float, mystical: float) -> Biome:
+    def _find_matching_biome_index(self, height: float, humidity: float,
+                                   temperature: float, mystical: float) -> int:
         """Find the best matching biome for the given environmental conditions.
         
         Args:
@@ -125,15 +143,15 @@ class MapManager:
             mystical: Mystical value
             
         Returns:
-            Biome: Best matching biome
+            int: Index of the best matching biome
         """
         # Try to find a matching biome
-        for biome in self._biomes:
+        for index, biome in enumerate(self._biomes):
             if biome.matches(height, humidity, temperature, mystical):
-                return biome
+                return index
                 
         # If no biome matches, return a random one as fallback
-        return random.choice(self._biomes)
+        return random.randrange(len(self._biomes))
 
     def render(self, surface) -> None:
         """Render the map on the given surface.
@@ -141,15 +159,16 @@ class MapManager:
         Args:
             surface: Surface to render on
         """
-        for row in self._tiles:
-            for tile in row:
+        colors = [biome.color for biome in self._biomes]
+        for y, row in enumerate(self._biome_indices.tolist()):
+            for x, index in enumerate(row):
                 rect = (
-                    tile.x * self._tile_size,
-                    tile.y * self._tile_size,
+                    x * self._tile_size,
+                    y * self._tile_size,
                     self._tile_size,
                     self._tile_size
                 )
-                surface.fill(tile.biome.color, rect)
+                surface.fill(colors[index], rect)
 
     def get_tile_at_pixel(self, px: int, py: int) -> Optional[Tile]:
         """Get the tile at the specified pixel coordinates.
@@ -165,7 +184,7 @@ class MapManager:
         ty = py // self._tile_size
         
         if 0 <= tx < self._width and 0 <= ty < self._height:
-            return self._tiles[ty][tx]
+            return self._get_tile(tx, ty)
         return None
 
     @property
@@ -185,8 +204,17 @@ class MapManager:
 
     @property
     def tiles(self) -> List[List[Tile]]:
-        """Get the tile grid."""
-        return self._tiles.copy()
+        """Get the tile grid.
+        
+        Every tile is created on first access. The grid is returned by
+        reference to avoid a copy per call; callers must treat it as read-only.
+        """
+        if self._tiles is None:
+            self._tiles = [
+                [self._get_tile(x, y) for x in range(self._width)]
+                for y in range(self._height)
+            ]
+        return self._tiles
 
     def __repr__(self) -> str:
         """Get a string representation of the map manager."""
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 import noise
+import numpy as np
 import random
 
 @dataclass
@@ -31,18 +32,18 @@ class BaseNoiseLayer:
         self._height = height
         self._scale = scale
         self._seed = random.randint(0, 100000)
-        self._map: Optional[List[List[float]]] = None
+        self._map: Optional[np.ndarray] = None
         self._generate_map()
 
     def _generate_map(self) -> None:
         """Generate the noise map."""
         self._map = self._generate()
 
-    def _generate(self) -> List[List[float]]:
+    def _generate(self) -> np.ndarray:
         """Generate the noise values.
         
         Returns:
-            List[List[float]]: 2D array of noise values
+            np.ndarray: 2D array of noise values indexed as [x, y]
         """
         raise NotImplementedError("Subclasses must implement _generate")
 
@@ -65,7 +66,7 @@ class BaseNoiseLayer:
         if self._map is None:
             self._generate_map()
             
-        return self._map[x][y]
+        return float(self._map[x, y])
 
     @property
     def width(self) -> int:
@@ -77,6 +78,13 @@ class BaseNoiseLayer:
         """Get the height of the noise map."""
         return self._height
 
+    @property
+    def values(self) -> np.ndarray:
+        """Get the full noise map as an array indexed as [x, y]."""
+        if self._map is None:
+            self._generate_map()
+        return self._map
+
     @property
     def scale(self) -> float:
         """Get the scale factor."""
@@ -87,28 +95,34 @@ class BaseNoiseLayer:
         """Get the random seed."""
         return self._seed
 
-    def _transform_noise_value(self, value: float) -> float:
-        """Transform the noise value to spread it more on extremes."""
-        # Transform the value from [-1, 1] to [-2, 2]
-        spread_value = value * 2  # Scale to spread more extremes
+    def _transform_noise_values(self, values: np.ndarray) -> np.ndarray:
+        """Transform the noise values to spread them more on extremes."""
+        # Transform the values from [-1, 1] to [-2, 2]
+        values *= 2  # Scale to spread more extremes
         
-        # Transform the value from [-1, 1] to [0, 1]
-        normalized_value = (spread_value + 1) / 2
-        # Clamp the value to ensure it stays within [0, 1]
-        return max(0, min(1, normalized_value))
+        # Transform the values from [-1, 1] to [0, 1]
+        values += 1
+        values /= 2
+        # Clamp the values to ensure they stay within [0, 1]
+        return np.clip(values, 0, 1, out=values)
 
-    def _generate_noise(self, _params: NoiseParameters) -> List[List[float]]:
+    def _generate_noise(self, _params: NoiseParameters) -> np.ndarray:
         """Generate noise using Perlin noise."""
-        return [
-            [self._transform_noise_value(noise.pnoise2(
-                (x + self._seed) / (self._scale * _params.scale_factor),
-                (y + self._seed) / (self._scale * _params.scale_factor),
-                octaves=_params.octaves,
-                persistence=_params.persistence,
-                lacunarity=_params.lacunarity
-            )) for y in range(self._height)]
-            for x in range(self._width)
-        ]
+        values = np.empty((self._width, self._height), dtype=np.float32)
+        inv_scale = 1.0 / (self._scale * _params.scale_factor)
+        xs = (np.arange(self._width) + self._seed) * inv_scale
+        ys = (np.arange(self._height) + self._seed) * inv_scale
+        # pnoise2 already runs the octave loop in C, so the per-sample cost is
+        # dominated by argument parsing: bind the layer's fixed octave settings
+        # once and pass them positionally.
+        pnoise2 = noise.pnoise2
+        octaves = _params.octaves
+        persistence = _params.persistence
+        lacunarity = _params.lacunarity
+        ys_list = ys.tolist()
+        for i, nx in enumerate(xs.tolist()):
+            values[i] = [pnoise2(nx, ny, octaves, persistence, lacunarity) for ny in ys_list]
+        return self._transform_noise_values(values)
 
 class HeightNoiseLayer(BaseNoiseLayer):
     """Noise layer for height map with sharp peaks and valleys."""
@@ -118,7 +132,7 @@ class HeightNoiseLayer(BaseNoiseLayer):
         self._params = NoiseParameters(octaves=2, persistence=0.8, lacunarity=2.0)
         super().__init__(width, height, scale)
 
-    def _generate(self) -> List[List[float]]:
+    def _generate(self) -> np.ndarray:
         """Generate height noise with sharp peaks and valleys."""
         return self._generate_noise(self._params)
 
@@ -130,7 +144,7 @@ class HumidityNoiseLayer(BaseNoiseLayer):
         self._params = NoiseParameters(octaves=4, persistence=0.5, lacunarity=2.0)
         super().__init__(width, height, scale)
 
-    def _generate(self) -> List[List[float]]:
+    def _generate(self) -> np.ndarray:
         """Generate humidity noise with medium-sized patches."""
         return self._generate_noise(self._params)
 
@@ -142,7 +156,7 @@ class TemperatureNoiseLayer(BaseNoiseLayer):
         self._params = NoiseParameters(octaves=4, persistence=0.5, lacunarity=2.0, scale_factor=3.6)
         super().__init__(width, height, scale)
 
-    def _generate(self) -> List[List[float]]:
+    def _generate(self) -> np.ndarray:
         """Generate temperature noise with medium-sized patches."""
         return self._generate_noise(self._params)
 
@@ -154,6 +168,6 @@ class MysticalNoiseLayer(BaseNoiseLayer):
         self._params = NoiseParameters(octaves=6, persistence=0.3, lacunarity=2.0, scale_factor=9.0)
         super().__init__(width, height, scale)
 
-    def _generate(self) -> List[List[float]]:
+    def _generate(self) -> np.ndarray:
         """Generate mystical noise with large, smooth blending areas."""
         return self._generate_noise(self._params)
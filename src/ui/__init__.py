@@ -1,5 +1,5 @@
 from .core import Scene, SceneManager
-from .screens import TitleScreen, OptionsScreen, GameScreen
+from .screens import TitleScreen, OptionsScreen, GameScreen, preload_game_map
 from .style import StyleManager, FontSize
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     'TitleScreen',
     'OptionsScreen',
     'GameScreen',
+    'preload_game_map',
     'StyleManager',
     'FontSize'
 ] 
\ No newline at end of file
@@ -0,0 +1,170 @@
+import pygame
+from typing import List, Dict, Callable, Optional
+from ui.style import StyleManager, FontSize
+from ._fonts import render_text, to_display_format
+
+# pygame.draw.rects is only provided by some pygame builds
+_HAS_DRAW_RECTS = hasattr(pygame.draw, "rects")
+
+class CheckboxList:
+    """Titled panel holding one column of labelled checkboxes.
+
+    The panel is composed into a cached surface that is only redrawn when its
+    content changes; the hover highlight is drawn on top of it each frame.
+    Subclasses can extend the panel by overriding _panel_height, _layout,
+    rebuild_labels and _redraw_to_cache.
+    """
+
+    padding = 10
+    width = 200
+
+    def __init__(self, x: int, y: int, title: str, items: List[str], initial: bool,
+                 on_change: Callable[[Dict[str, bool]], None]):
+        self._x = x
+        self._y = y
+        self.title = title
+        self.items = items
+        self.checked = {item: initial for item in items}
+        self.on_change = on_change
+        style_manager = self._style_manager = StyleManager.get_instance()
+        self.style = style_manager.get_style()
+        self.checkbox_size = 20
+        self.spacing = 30
+        self.hovered_checkbox = None
+        self._style_version = style_manager.version
+        self._dirty = True
+        self._cached_panel: Optional[pygame.Surface] = None
+        self._layout()
+        self.rebuild_labels()
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int):
+        self._x = value
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int):
+        self._y = value
+
+    def _list_height(self) -> int:
+        """Height of the title and checkbox section"""
+        return len(self.items) * self.spacing + self.padding * 2
+
+    def _panel_height(self) -> int:
+        """Height of the panel background"""
+        return self._list_height()
+
+    def _layout(self):
+        """Precompute the panel and checkbox geometry relative to the panel origin"""
+        padding = self.padding
+        self._bg_rect = pygame.Rect(0, 0, self.width, self._panel_height())
+        self._title_pos = (padding, padding)
+        self._checkbox_rects = [
+            pygame.Rect(padding, padding + 30 + i * self.spacing, self.checkbox_size, self.checkbox_size)
+            for i in range(len(self.items))
+        ]
+        self._label_positions = [(rect.right + 10, rect.y) for rect in self._checkbox_rects]
+        # Checkboxes form one evenly spaced column, so hit-testing is a bounds check and a division
+        self._hit_x0 = padding
+        self._hit_x1 = padding + self.checkbox_size
+        self._hit_y0 = padding + 30
+        self._hit_step = self.spacing
+        self._hit_h = self.checkbox_size
+        self._hit_n = len(self.items)
+        # Bounds of everything the panel draws, which the last checkbox can overhang
+        self._panel_rect = self._bg_rect.unionall(self._checkbox_rects)
+        self._panel_size = self._panel_rect.size
+
+    def rebuild_labels(self):
+        """Pre-render the title and checkbox labels with the current style"""
+        font = self.style.get_font(FontSize.BODY)
+        text_color = self.style.get_color("text")
+        self._title_surface = render_text(font, self.title, text_color)
+        self._label_surfaces = [render_text(font, item, text_color) for item in self.items]
+        self._style_version = self._style_manager.version
+        self._dirty = True
+
+    def _redraw_to_cache(self):
+        """Draw the whole panel into the cached surface"""
+        surface = self._cached_panel = pygame.Surface(self._panel_size, pygame.SRCALPHA)
+        get_color = self.style.get_color
+        border_color = get_color("border")
+        primary_color = get_color("primary")
+        draw_rect = pygame.draw.rect
+
+        # Draw background
+        draw_rect(surface, get_color("surface"), self._bg_rect)
+        draw_rect(surface, border_color, self._bg_rect, 2)
+
+        # Draw title
+        surface.blit(self._title_surface, self._title_pos)
+
+        # Draw checkboxes, batched into one call per color when supported
+        active_rects = [
+            checkbox_rect.inflate(-4, -4)
+            for checkbox_rect, item in zip(self._checkbox_rects, self.items)
+            if self.checked[item]
+        ]
+        if _HAS_DRAW_RECTS:
+            pygame.draw.rects(surface, border_color, self._checkbox_rects)
+            pygame.draw.rects(surface, primary_color, active_rects)
+        else:
+            for checkbox_rect in self._checkbox_rects:
+                draw_rect(surface, border_color, checkbox_rect)
+            for active_rect in active_rects:
+                draw_rect(surface, primary_color, active_rect)
+
+        # Draw labels
+        surface.blits(list(zip(self._label_surfaces, self._label_positions)), doreturn=False)
+
+    def draw(self, surface: pygame.Surface):
+        if self._style_manager.version != self._style_version:
+            self.style = self._style_manager.get_style()
+            self.rebuild_labels()
+        if self._dirty:
+            self._redraw_to_cache()
+            self._cached_panel = to_display_format(self._cached_panel)
+            self._dirty = False
+        surface.blit(self._cached_panel, (self.x, self.y))
+
+        # The hover highlight is the only part that changes with the mouse, so it is
+        # drawn over the cached panel instead of being composed into it
+        if self.hovered_checkbox is not None:
+            pygame.draw.rect(surface, self.style.get_color("hover"),
+                             self._checkbox_rects[self.hovered_checkbox].move(self.x, self.y), 2)
+
+    def handle_event(self, event: pygame.event.Event):
+        if event.type == pygame.MOUSEMOTION:
+            mx = event.pos[0] - self.x
+            my = event.pos[1] - self.y
+            # Most mouse moves are nowhere near the panel
+            if not self._panel_rect.collidepoint(mx, my):
+                self.hovered_checkbox = None
+                return
+
+            # Check if mouse is over any checkbox
+            dy = my - self._hit_y0
+            hovered_checkbox = None
+            if self._hit_x0 <= mx < self._hit_x1 and dy >= 0:
+                i = dy // self._hit_step
+                if i < self._hit_n and dy - i * self._hit_step < self._hit_h:
+                    hovered_checkbox = i
+            self.hovered_checkbox = hovered_checkbox
+
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            # Toggle checkbox if clicked
+            if self.hovered_checkbox is not None:
+                item = self.items[self.hovered_checkbox]
+                self.checked[item] = not self.checked[item]
+                self._dirty = True
+                self.on_change(self.checked)
+
+    def update(self):
+        pass
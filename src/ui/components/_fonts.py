@@ -0,0 +1,34 @@
+import pygame
+from functools import lru_cache
+from typing import Tuple
+
+def to_display_format(surface: pygame.Surface, alpha: bool = True) -> pygame.Surface:
+    """Convert a surface to the display pixel format so blitting it needs no conversion.
+    
+    Args:
+        surface: Surface to convert
+        alpha: Keep per-pixel alpha, for surfaces with transparent parts
+        
+    Returns:
+        pygame.Surface: The converted surface, or the surface unchanged while no display exists
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+@lru_cache(maxsize=512)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render anti-aliased text, sharing the surface between identical requests.
+    
+    Args:
+        font: Font to render with
+        text: Text to render
+        color: RGB text color
+        
+    Returns:
+        pygame.Surface: Rendered text, converted to the display format when a display exists
+    """
+    return to_display_format(font.render(text, True, color))
+
+# Rendered surfaces become invalid once pygame shuts down, so release them with it
+pygame.register_quit(render_text.cache_clear)
@@ -1,6 +1,7 @@
 import pygame
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 from .ui_component import UIComponent
+from ._fonts import render_text, to_display_format
 from ..style import StyleManager, FontSize
 
 class Button(UIComponent):
@@ -18,29 +19,77 @@ class Button(UIComponent):
         self.is_hovered = False
         self.style = StyleManager.get_instance().get_style()
         self.font = self.style.get_font(FontSize.BODY)
+        self._dirty = True
+        self._cached_panel: Optional[pygame.Surface] = None
+        self._cached_panel_key = None
+        # The hover state gets its own cache, rendered the first time the button is hovered
+        self._hover_cache: Optional[pygame.Surface] = None
+        self._hover_cache_key = None
+
+    def _render_panel(self, color: Tuple[int, int, int], text_color: Tuple[int, int, int],
+                      border_color: Tuple[int, int, int]) -> pygame.Surface:
+        """Draw the button background, border and text into a new surface"""
+        panel = pygame.Surface(self.rect.size)
+        panel_rect = panel.get_rect()
+        pygame.draw.rect(panel, color, panel_rect)
+        pygame.draw.rect(panel, border_color, panel_rect, 2)  # Border
+
+        text_surface = render_text(self.font, self.text, text_color)
+        panel.blit(text_surface, text_surface.get_rect(center=panel_rect.center))
+        return to_display_format(panel, alpha=False)
 
     def draw(self, surface: pygame.Surface):
         if not self.visible:
             return
 
-        color = self.style.get_color(self.hover_color_type) if self.is_hovered else self.style.get_color(self.color_type)
-        pygame.draw.rect(surface, color, self.rect)
-        pygame.draw.rect(surface, self.style.get_color("border"), self.rect, 2)  # Border
+        surface.blit(self._refresh_cache(), self.rect)
+
+    def get_blit_pair(self) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Return the cached button surface and its destination"""
+        if not self.visible:
+            return None
+        return self._refresh_cache(), self.rect
 
-        text_surface = self.font.render(self.text, True, self.style.get_color(self.text_color_type))
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+    def _refresh_cache(self) -> pygame.Surface:
+        """Redraw the cached surface for the current hover state if needed and return it"""
+        if self._dirty:
+            self._cached_panel_key = self._hover_cache_key = None
+            self._dirty = False
+        get_color = self.style.get_color
+        text_color = get_color(self.text_color_type)
+        border_color = self.style.border
+        # Text and color types are public attributes, so changes are also caught by comparing keys
+        if self.is_hovered:
+            color = get_color(self.hover_color_type)
+            panel_key = (color, text_color, border_color, self.text, self.rect.size)
+            if panel_key != self._hover_cache_key:
+                self._hover_cache = self._render_panel(color, text_color, border_color)
+                self._hover_cache_key = panel_key
+            return self._hover_cache
+        color = get_color(self.color_type)
+        panel_key = (color, text_color, border_color, self.text, self.rect.size)
+        if panel_key != self._cached_panel_key:
+            self._cached_panel = self._render_panel(color, text_color, border_color)
+            self._cached_panel_key = panel_key
+        return self._cached_panel
 
     def handle_event(self, event: pygame.event.Event):
         if not self.visible:
             return
 
         if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
+            self.update_hover(event.pos)
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.is_hovered:
                 self.action()
 
+    def update_hover(self, pos: Tuple[int, int]):
+        """Update the hover state for a mouse position"""
+        if not self.visible:
+            return
+        # Both states keep their own cached surface, so nothing needs redrawing here
+        self.is_hovered = self.rect.collidepoint(pos)
+
     def is_clicked(self, pos: Tuple[int, int]) -> bool:
         """Check if the button is clicked at the given position"""
         return self.rect.collidepoint(pos)
@@ -51,9 +100,14 @@ class Button(UIComponent):
 
     def update_style(self, color_type: str = None, hover_color_type: str = None, text_color_type: str = None):
         """Update the button's color types"""
+        self.invalidate()
         if color_type:
             self.color_type = color_type
         if hover_color_type:
             self.hover_color_type = hover_color_type
         if text_color_type:
-            self.text_color_type = text_color_type 
\ No newline at end of file
+            self.text_color_type = text_color_type 
+
+    def invalidate(self):
+        """Force both cached states of the button to be redrawn on their next draw"""
+        self._dirty = True
\ No newline at end of file
@@ -2,9 +2,15 @@ import pygame
 import threading
 import time
 import math
+import numpy as np
 from typing import Callable, Optional, Tuple
 from .ui_component import UIComponent
-from ..style.style_manager import StyleManager
+from ._fonts import to_display_format
+from ..style.style_manager import StyleManager, FontSize
+
+# Unit circle points of the spinner arc, 270 degrees in 10 degree steps, rotated into place each frame
+_ARC_DEGREES = np.arange(0, 270, 10)
+_UNIT = np.stack([np.cos(np.deg2rad(_ARC_DEGREES)), np.sin(np.deg2rad(_ARC_DEGREES))], axis=1).astype(np.float32)
 
 class LoadingScreen(UIComponent):
     """Loading screen component that displays a loading spinner and message.
@@ -13,6 +19,8 @@ class LoadingScreen(UIComponent):
     is in progress, such as map generation.
     """
     
+    _instance: Optional['LoadingScreen'] = None
+    
     def __init__(self, 
                  message: str = "Loading...",
                  spinner_size: int = 40,
@@ -29,16 +37,44 @@ class LoadingScreen(UIComponent):
         super().__init__(0, 0, 0, 0)
         self._message = message
         self._spinner_size = spinner_size
-        self._style = StyleManager.get_instance().get_style()
-        self._spinner_color = spinner_color or self._style.get_color("primary")
-        self._text_color = text_color or self._style.get_color("text")
+        self._style_manager = StyleManager.get_instance()
+        self._style = self._style_manager.get_style()
+        # Explicit colors are kept across style changes, the defaults follow the style
+        self._spinner_color_override = spinner_color
+        self._text_color_override = text_color
         self._angle = 0
         self._last_update = time.time()
         self._bg_color = (0, 0, 0, 180)  # Semi-transparent background
-        self._font = pygame.font.Font(None, 36)
+        self._font = self._style.get_font(FontSize.HEADING)
         self._is_visible = False
-        self._task_completed = False
+        self._task_done = threading.Event()
+        self._task_callback: Optional[Callable] = None
+        self._task_exception: Optional[BaseException] = None
         self._task_thread = None
+        self._overlay: Optional[pygame.Surface] = None
+        self._text_surface: Optional[pygame.Surface] = None
+        self._refresh_style()
+        
+    def _refresh_style(self) -> None:
+        """Re-read the colors of the current style and re-render the text with them."""
+        self._spinner_color = self._spinner_color_override or self._style.get_color("primary")
+        self._text_color = self._text_color_override or self._style.get_color("text")
+        self._style_version = self._style_manager.version
+        self._dirty = True
+        
+    @classmethod
+    def get_instance(cls) -> 'LoadingScreen':
+        """Get the loading screen shared by all scenes.
+        
+        Sharing it keeps the overlay and rendered text across scene changes.
+        
+        Returns:
+            LoadingScreen: The shared loading screen
+        """
+        instance = cls._instance
+        if instance is None:
+            instance = cls._instance = cls()
+        return instance
         
     def _render_text(self) -> pygame.Surface:
         """Render the loading message text.
@@ -53,19 +89,25 @@ class LoadingScreen(UIComponent):
         
         Args:
             task: Function to execute in the background
-            callback: Optional callback to execute when task completes
+            callback: Optional callback to execute when task completes. It runs on the
+                main thread from update(), not on the worker thread.
         """
         self._is_visible = True
-        self._task_completed = False
+        # Each task gets its own event so a previous thread cannot signal this one
+        task_done = self._task_done = threading.Event()
+        self._task_callback = callback
+        self._task_exception = None
         
         def thread_wrapper():
-            # Execute the task
-            task()
-            # Mark as completed
-            self._task_completed = True
-            # Execute callback if provided
-            if callback:
-                callback()
+            try:
+                # Execute the task
+                task()
+            except Exception as e:
+                # Surfaced on the main thread by update()
+                self._task_exception = e
+            finally:
+                # Mark as completed even if the task failed
+                task_done.set()
         
         # Start the thread
         self._task_thread = threading.Thread(target=thread_wrapper)
@@ -73,10 +115,17 @@ class LoadingScreen(UIComponent):
         self._task_thread.start()
         
     def update(self) -> None:
-        """Update the loading screen animation."""
+        """Update the loading screen animation and finish a completed task.
+        
+        Raises:
+            Exception: Any exception raised by the background task
+        """
         if not self._is_visible:
             return
             
+        if self._style_manager.version != self._style_version:
+            self._refresh_style()
+            
         # Update spinner rotation
         current_time = time.time()
         elapsed = current_time - self._last_update
@@ -84,8 +133,15 @@ class LoadingScreen(UIComponent):
         self._last_update = current_time
         
         # Hide if task is completed
-        if self._task_completed:
+        if self._task_done.is_set():
             self._is_visible = False
+            callback, self._task_callback = self._task_callback, None
+            exception, self._task_exception = self._task_exception, None
+            if exception is not None:
+                raise exception
+            # Execute callback if provided
+            if callback:
+                callback()
             
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the loading screen.
@@ -96,13 +152,18 @@ class LoadingScreen(UIComponent):
         if not self._is_visible:
             return
             
+        # The instance is shared across scenes, so it can outlive a style change
+        if self._style_manager.version != self._style_version:
+            self._refresh_style()
+            
         # Get surface dimensions
         width, height = surface.get_size()
         
-        # Create overlay
-        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-        overlay.fill(self._bg_color)
-        surface.blit(overlay, (0, 0))
+        # Create overlay once per surface size
+        if self._overlay is None or self._overlay.get_size() != (width, height):
+            self._overlay = to_display_format(pygame.Surface((width, height), pygame.SRCALPHA))
+            self._overlay.fill(self._bg_color)
+        surface.blit(self._overlay, (0, 0))
         
         # Draw spinner
         spinner_rect = pygame.Rect(0, 0, self._spinner_size, self._spinner_size)
@@ -111,23 +172,19 @@ class LoadingScreen(UIComponent):
         # Draw spinner arc
         radius = self._spinner_size // 2
         center = spinner_rect.center
-        start_angle = self._angle
-        end_angle = (self._angle + 270) % 360
-        
-        arc_points = []
-        for angle in range(int(start_angle), int(end_angle), 10):
-            rad = angle * math.pi / 180
-            x = center[0] + int(radius * 0.8 * math.cos(rad))
-            y = center[1] + int(radius * 0.8 * math.sin(rad))
-            arc_points.append((x, y))
-            
-        if arc_points:
-            pygame.draw.lines(surface, self._spinner_color, False, arc_points, 6)
-        
-        # Draw text message
-        text_surface = self._render_text()
-        text_rect = text_surface.get_rect(center=(width // 2, height // 2 + 30))
-        surface.blit(text_surface, text_rect)
+        # Rotating the precomputed arc keeps it whole when the angle wraps past 360
+        rot = math.radians(self._angle)
+        c, s = math.cos(rot), math.sin(rot)
+        rotation = np.array([[c, -s], [s, c]], dtype=np.float32)
+        arc_points = (_UNIT @ rotation.T) * (radius * 0.8) + np.array(center, dtype=np.float32)
+        pygame.draw.lines(surface, self._spinner_color, False, arc_points.astype(np.int32).tolist(), 6)
+        
+        # Draw text message, re-rendered only when the message changes
+        if self._dirty:
+            self._text_surface = self._render_text()
+            self._dirty = False
+        text_rect = self._text_surface.get_rect(center=(width // 2, height // 2 + 30))
+        surface.blit(self._text_surface, text_rect)
         
     def is_visible(self) -> bool:
         """Check if the loading screen is visible.
@@ -137,6 +194,10 @@ class LoadingScreen(UIComponent):
         """
         return self._is_visible
         
+    def show(self) -> None:
+        """Show the loading screen without starting a task."""
+        self._is_visible = True
+        
     def hide(self) -> None:
         """Hide the loading screen."""
         self._is_visible = False
@@ -147,4 +208,6 @@ class LoadingScreen(UIComponent):
         Args:
             message: New message to display
         """
-        self._message = message 
\ No newline at end of file
+        if message != self._message:
+            self._message = message
+            self._dirty = True 
\ No newline at end of file
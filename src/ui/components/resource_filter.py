@@ -1,26 +1,96 @@
 import pygame
-from typing import List, Dict, Callable
-from config import Config
-from ui.style import StyleManager, FontSize
+import numpy as np
+from typing import List, Dict, Callable, Optional, Tuple
+from ui.style import FontSize
+from ._checkbox_list import CheckboxList
+from ._fonts import render_text
 
-class ResourceFilter:
+class ResourceFilter(CheckboxList):
     def __init__(self, x: int, y: int, resource_types: List[str], on_filter_change: Callable[[Dict[str, bool]], None]):
-        self.config = Config()
-        self.x = x
-        self.y = y
-        self.resource_types = resource_types
-        self.on_filter_change = on_filter_change
-        self.style = StyleManager.get_instance().get_style()
-        self.checkbox_size = 20
-        self.spacing = 30
-        self.filters = {resource: True for resource in resource_types}
-        self.hovered_checkbox = None
+        # The stats section is rendered from these while the base class builds the panel
         self.resource_counts = {resource: 0 for resource in resource_types}
         self.total_biomes = 0
+        self._stat_cache: Dict[str, Tuple[Tuple[int, int], pygame.Surface]] = {}
+        super().__init__(x, y, "Resource Filter", resource_types, True, on_filter_change)
+        self.resource_types = self.items
+        self.on_filter_change = self.on_change
+        self.filters = self.checked
+
+    def _panel_height(self) -> int:
+        stats_height = len(self.items) * 20 + self.padding * 2  # 20 pixels per stat line
+        return self._list_height() + stats_height + 10  # 10 pixels gap between sections
+
+    def _layout(self):
+        """Precompute the panel, checkbox and statistics geometry relative to the panel origin"""
+        super()._layout()
+        padding = self.padding
+        separator_y = self._list_height()
+        self._separator = ((padding, separator_y), (self.width - padding, separator_y))
+        self._stats_title_pos = (padding, separator_y + padding)
+        self._stat_positions = [
+            (padding, separator_y + padding + 30 + i * 20)
+            for i in range(len(self.items))
+        ]
+
+    def rebuild_labels(self):
+        """Pre-render the titles, checkbox labels and stat prefixes with the current style"""
+        if self._style_version != self._style_manager.version:
+            # Surfaces rendered with the previous palette will not be requested again
+            render_text.cache_clear()
+        super().rebuild_labels()
+        self._stats_title_surface = render_text(
+            self.style.get_font(FontSize.BODY), "Resource Distribution", self.style.get_color("text")
+        )
+        small_font = self.style.get_font(FontSize.SMALL)
+        text_secondary_color = self.style.get_color("text_secondary")
+        self._stat_prefix_surfaces = [
+            render_text(small_font, f"{resource}: ", text_secondary_color)
+            for resource in self.items
+        ]
+        self._stat_cache.clear()
+        self._render_stat_values()
+
+    def _render_stat_values(self):
+        """Render the count and percentage part of each resource statistic.
+
+        Each resource keeps its last (count, total) key next to its surface, so the
+        text is only formatted again for resources whose numbers changed.
+        """
+        total = self.total_biomes
+        stat_cache = self._stat_cache
+        small_font = None
+        for resource in self.items:
+            count = self.resource_counts[resource]
+            key = (count, total)
+            if stat_cache.get(resource, (None,))[0] == key:
+                continue
+            if small_font is None:
+                small_font = self.style.get_font(FontSize.SMALL)
+                text_secondary_color = self.style.get_color("text_secondary")
+            percentage = (count / total * 100) if total > 0 else 0
+            stat_cache[resource] = (key, render_text(small_font, f"{count} ({percentage:.1f}%)", text_secondary_color))
+            self._dirty = True
+
+    def update_resource_stats(self, biome_grid, resource_ids: Optional[np.ndarray] = None):
+        """Recount the resources shown in the distribution section.
+        
+        Args:
+            biome_grid: 2D grid of biomes (None for empty cells)
+            resource_ids: Optional uint8 array of the same grid holding the index of each
+                cell's resource in resource_types, or 255 for empty cells. When given the
+                counts are computed from it instead of walking biome_grid.
+        """
+        if resource_ids is not None:
+            flat = resource_ids.ravel()
+            flat = flat[flat != 255]
+            counts = np.bincount(flat, minlength=len(self.items))
+            self.resource_counts = dict(zip(self.items, counts.tolist()))
+            self.total_biomes = int(flat.size)
+            self._render_stat_values()
+            return
 
-    def update_resource_stats(self, biome_grid):
         # Reset counts
-        self.resource_counts = {resource: 0 for resource in self.resource_types}
+        self.resource_counts = {resource: 0 for resource in self.items}
         self.total_biomes = 0
 
         # Count biomes for each resource type
@@ -30,77 +100,22 @@ class ResourceFilter:
                     self.resource_counts[biome.resource_type] += 1
                     self.total_biomes += 1
 
-    def draw(self, surface: pygame.Surface):
-        # Draw background
-        padding = 10
-        width = 200
-        # Calculate height to fit both filter and stats
-        filter_height = len(self.resource_types) * self.spacing + padding * 2
-        stats_height = len(self.resource_types) * 20 + padding * 2  # 20 pixels per stat line
-        total_height = filter_height + stats_height + 10  # 10 pixels gap between sections
-        
-        bg_rect = pygame.Rect(self.x, self.y, width, total_height)
-        pygame.draw.rect(surface, self.style.get_color("surface"), bg_rect)
-        pygame.draw.rect(surface, self.style.get_color("border"), bg_rect, 2)
-
-        # Draw title
-        title = self.style.get_font(FontSize.BODY).render("Resource Filter", True, self.style.get_color("text"))
-        surface.blit(title, (self.x + padding, self.y + padding))
+        self._render_stat_values()
 
-        # Draw checkboxes and labels
-        for i, resource in enumerate(self.resource_types):
-            y = self.y + padding + 30 + i * self.spacing
-            checkbox_rect = pygame.Rect(self.x + padding, y, self.checkbox_size, self.checkbox_size)
-            
-            # Draw checkbox
-            pygame.draw.rect(surface, self.style.get_color("border"), checkbox_rect)
-            if self.filters[resource]:
-                pygame.draw.rect(surface, self.style.get_color("primary"), checkbox_rect.inflate(-4, -4))
-            
-            # Draw label
-            label = self.style.get_font(FontSize.BODY).render(resource, True, self.style.get_color("text"))
-            surface.blit(label, (self.x + padding + self.checkbox_size + 10, y))
-
-            # Highlight hovered checkbox
-            if self.hovered_checkbox == i:
-                pygame.draw.rect(surface, self.style.get_color("hover"), checkbox_rect, 2)
+    def _redraw_to_cache(self):
+        """Draw the filter panel followed by the resource statistics"""
+        super()._redraw_to_cache()
+        surface = self._cached_panel
 
         # Draw separator line
-        separator_y = self.y + filter_height
-        pygame.draw.line(surface, self.style.get_color("border"), 
-                        (self.x + padding, separator_y),
-                        (self.x + width - padding, separator_y))
+        pygame.draw.line(surface, self.style.get_color("border"), *self._separator)
 
         # Draw statistics title
-        stats_title = self.style.get_font(FontSize.BODY).render("Resource Distribution", True, self.style.get_color("text"))
-        surface.blit(stats_title, (self.x + padding, separator_y + padding))
+        surface.blit(self._stats_title_surface, self._stats_title_pos)
 
         # Draw resource statistics
-        for i, resource in enumerate(self.resource_types):
-            y = separator_y + padding + 30 + i * 20
-            count = self.resource_counts[resource]
-            percentage = (count / self.total_biomes * 100) if self.total_biomes > 0 else 0
-            stat_text = f"{resource}: {count} ({percentage:.1f}%)"
-            stat_label = self.style.get_font(FontSize.SMALL).render(stat_text, True, self.style.get_color("text_secondary"))
-            surface.blit(stat_label, (self.x + padding, y))
-
-    def handle_event(self, event: pygame.event.Event):
-        if event.type == pygame.MOUSEMOTION:
-            # Check if mouse is over any checkbox
-            self.hovered_checkbox = None
-            for i, resource in enumerate(self.resource_types):
-                y = self.y + 40 + i * self.spacing
-                checkbox_rect = pygame.Rect(self.x + 10, y, self.checkbox_size, self.checkbox_size)
-                if checkbox_rect.collidepoint(event.pos):
-                    self.hovered_checkbox = i
-                    break
-
-        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            # Toggle checkbox if clicked
-            if self.hovered_checkbox is not None:
-                resource = self.resource_types[self.hovered_checkbox]
-                self.filters[resource] = not self.filters[resource]
-                self.on_filter_change(self.filters)
-
-    def update(self):
-        pass 
\ No newline at end of file
+        blit = surface.blit
+        stat_cache = self._stat_cache
+        for (x, y), prefix, resource in zip(self._stat_positions, self._stat_prefix_surfaces, self.items):
+            blit(prefix, (x, y))
+            blit(stat_cache[resource][1], (x + prefix.get_width(), y))
\ No newline at end of file
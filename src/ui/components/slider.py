@@ -1,11 +1,19 @@
 from typing import Callable, Optional
 import pygame
 from .ui_component import UIComponent
+from ._fonts import render_text, to_display_format
 from ..style.style_manager import StyleManager, FontSize
 
 class Slider(UIComponent):
     """A slider component for selecting values within a range."""
     
+    __slots__ = (
+        '_style_manager', '_style', '_min_value', '_max_value', '_value', '_on_value_change',
+        '_is_dragging', '_label', '_label_surface', '_value_key', '_value_surface',
+        '_track_surface', '_track_key', '_handle_rect', '_handle_offset', '_dirty',
+        '_c_surface', '_c_border', '_c_primary', '_c_text', '_font_small', '_style_version'
+    )
+    
     def __init__(
         self,
         x: int,
@@ -32,13 +40,36 @@ class Slider(UIComponent):
             label: Optional label text for the slider
         """
         super().__init__(x, y, width, height)
-        self._style = StyleManager.get_instance().get_style()
+        self._style_manager = StyleManager.get_instance()
+        self._style = self._style_manager.get_style()
         self._min_value = min_value
         self._max_value = max_value
         self._value = initial_value
         self._on_value_change = on_value_change
         self._is_dragging = False
         self._label = label
+        self._label_surface: Optional[pygame.Surface] = None
+        self._value_key: Optional[int] = None
+        self._value_surface: Optional[pygame.Surface] = None
+        self._track_surface: Optional[pygame.Surface] = None
+        self._track_key = None
+        self._handle_rect = pygame.Rect(0, 0, 10, height + 10)
+        self._handle_offset = 0
+        self._dirty = True
+        self._refresh_style()
+        
+    def _refresh_style(self) -> None:
+        """Cache the colors and font of the current style and drop surfaces drawn with the old ones."""
+        get_color = self._style.get_color
+        self._c_surface = get_color("surface")
+        self._c_border = get_color("border")
+        self._c_primary = get_color("primary")
+        self._c_text = get_color("text")
+        self._font_small = self._style.get_font(FontSize.SMALL)
+        self._style_version = self._style_manager.version
+        self._label_surface = None
+        self._value_key = None
+        self._track_key = None
         
     @property
     def value(self) -> float:
@@ -53,9 +84,15 @@ class Slider(UIComponent):
             new_value: The new value to set
         """
         self._value = max(self._min_value, min(self._max_value, new_value))
+        self._dirty = True
         if self._on_value_change:
             self._on_value_change(self._value)
             
+    @property
+    def is_dragging(self) -> bool:
+        """Check whether the handle is being dragged."""
+        return self._is_dragging
+        
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle pygame events.
         
@@ -77,59 +114,106 @@ class Slider(UIComponent):
                 return True
                 
         elif event.type == pygame.MOUSEMOTION:
-            if self._is_dragging:
-                self._update_value_from_mouse(event.pos[0])
-                return True
+            return self.drag_to(event.pos[0])
                 
         return False
         
+    def drag_to(self, mouse_x: int) -> bool:
+        """Move the handle to the mouse position while it is being dragged.
+        
+        Args:
+            mouse_x: The x position of the mouse
+            
+        Returns:
+            bool: True if the handle was being dragged, False otherwise
+        """
+        if not self._is_dragging:
+            return False
+        self._update_value_from_mouse(mouse_x)
+        return True
+        
     def _update_value_from_mouse(self, mouse_x: int) -> None:
         """Update the slider value based on mouse position.
         
         Args:
             mouse_x: The x position of the mouse
         """
-        relative_x = mouse_x - self.rect.x
-        percentage = max(0.0, min(1.0, relative_x / self.rect.width))
+        rect = self.rect
+        percentage = (mouse_x - rect.x) / rect.width
+        # Inline clamp to [0, 1], cheaper than calling min() and max() on every drag event
+        percentage = percentage if percentage < 1.0 else 1.0
+        percentage = percentage if percentage > 0.0 else 0.0
         self.value = self._min_value + (self._max_value - self._min_value) * percentage
         
+    def get_draw_bounds(self) -> Optional[pygame.Rect]:
+        """Get the area covered by the track, the handle and the texts.
+        
+        Returns:
+            Optional[pygame.Rect]: Drawn area, or None while the texts have not been rendered yet
+        """
+        # The handle overhangs the track by 5 pixels above and below
+        bounds = self.rect.inflate(0, 10)
+        if self._label:
+            if self._label_surface is None or self._value_surface is None:
+                return None
+            bounds.union_ip(self._label_surface.get_rect(
+                x=self.rect.x, y=self.rect.y - self._label_surface.get_height() - 5
+            ))
+            bounds.union_ip(self._value_surface.get_rect(
+                x=self.rect.right + 10,
+                y=self.rect.y + (self.rect.height - self._value_surface.get_height()) // 2
+            ))
+        return bounds
+        
     def draw(self, surface: pygame.Surface) -> None:
         """Draw the slider on the surface.
         
         Args:
             surface: The surface to draw on
         """
+        if self._style_manager.version != self._style_version:
+            self._refresh_style()
+            
         # Draw label if present
         if self._label:
-            font = self._style.get_font(FontSize.SMALL)
-            label_text = font.render(self._label, True, self._style.get_color("text"))
-            label_rect = label_text.get_rect(
-                x=self.rect.x,
-                y=self.rect.y - label_text.get_height() - 5
+            if self._label_surface is None:
+                # The label is static, so it is only rendered again when the style changes
+                self._label_surface = render_text(self._font_small, self._label, self._c_text)
+            surface.blit(
+                self._label_surface,
+                (self.rect.x, self.rect.y - self._label_surface.get_height() - 5)
             )
-            surface.blit(label_text, label_rect)
             
-            # Draw value
-            value_text = font.render(f"{self._value:.0f}", True, self._style.get_color("text"))
-            value_rect = value_text.get_rect(
-                x=self.rect.right + 10,
-                y=self.rect.y + (self.rect.height - value_text.get_height()) // 2
+            # Draw value, rendered again only when the displayed number changes
+            value_key = round(self._value)
+            if value_key != self._value_key:
+                self._value_key = value_key
+                self._value_surface = render_text(self._font_small, str(value_key), self._c_text)
+            surface.blit(
+                self._value_surface,
+                (self.rect.right + 10, self.rect.y + (self.rect.height - self._value_surface.get_height()) // 2)
             )
-            surface.blit(value_text, value_rect)
-        
-        # Draw the track
-        pygame.draw.rect(surface, self._style.get_color("surface"), self.rect)
-        pygame.draw.rect(surface, self._style.get_color("border"), self.rect, 1)
-        
-        # Calculate the position of the handle
-        percentage = (self._value - self._min_value) / (self._max_value - self._min_value)
-        handle_x = self.rect.x + int(self.rect.width * percentage)
-        handle_rect = pygame.Rect(
-            handle_x - 5,
-            self.rect.y - 5,
-            10,
-            self.rect.height + 10
-        )
+        
+        # Draw the track from a cached surface holding the fill and border
+        if self.rect.size != self._track_key:
+            self._track_key = self.rect.size
+            track = pygame.Surface(self.rect.size)
+            track_rect = track.get_rect()
+            pygame.draw.rect(track, self._c_surface, track_rect)
+            pygame.draw.rect(track, self._c_border, track_rect, 1)
+            self._track_surface = to_display_format(track, alpha=False)
+            self._dirty = True
+        surface.blit(self._track_surface, self.rect)
+        
+        # Calculate the position of the handle when the value changed
+        if self._dirty:
+            percentage = (self._value - self._min_value) / (self._max_value - self._min_value)
+            self._handle_offset = int(self.rect.width * percentage)
+            self._handle_rect.height = self.rect.height + 10
+            self._dirty = False
+        handle_rect = self._handle_rect
+        handle_rect.x = self.rect.x + self._handle_offset - 5
+        handle_rect.y = self.rect.y - 5
         
         # Draw the handle
-        pygame.draw.rect(surface, self._style.get_color("primary"), handle_rect) 
\ No newline at end of file
+        pygame.draw.rect(surface, self._c_primary, handle_rect)
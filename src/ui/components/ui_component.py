@@ -1,7 +1,9 @@
 import pygame
-from typing import Callable, Tuple
+from typing import Callable, Optional, Tuple
 
 class UIComponent:
+    __slots__ = ('rect', 'visible')
+
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.visible = True
@@ -9,8 +11,31 @@ class UIComponent:
     def draw(self, surface: pygame.Surface):
         pass
 
+    def get_draw_bounds(self) -> Optional[pygame.Rect]:
+        """Return the screen area draw() can touch, or None if it is not known yet.
+
+        Containers use it to skip components outside the surface clip rect.
+        """
+        return self.rect
+
+    def get_blit_pair(self) -> Optional[Tuple[pygame.Surface, pygame.Rect]]:
+        """Return a (surface, destination) pair when the whole component is one cached surface.
+
+        Containers batch these pairs into a single blits call. Components returning None
+        are drawn through draw() instead.
+        """
+        return None
+
     def handle_event(self, event: pygame.event.Event):
         pass
 
+    def update_hover(self, pos: Tuple[int, int]):
+        """Update hover state for a mouse position.
+
+        Containers that coalesce mouse motion call this once per frame instead of
+        forwarding every MOUSEMOTION event.
+        """
+        pass
+
     def update(self):
         pass 
\ No newline at end of file
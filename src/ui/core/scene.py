@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Any, List, Mapping, Tuple
 import pygame
 from config import Config
 
@@ -14,8 +15,17 @@ class Scene(ABC):
         _config: Game configuration object
         _next_scene: Name of the next scene to transition to
         _scene_data: Data to pass to the next scene
+        WANTED_EVENT_TYPES: Event types the scene handles, or None for all. Other
+            types are blocked at the queue while the scene is active.
+        PAINTS_FULL_SURFACE: Whether draw() covers every pixel whenever the scene
+            manager requests a full redraw, so the manager can skip clearing first.
     """
     
+    WANTED_EVENT_TYPES: Optional[Tuple[int, ...]] = None
+    PAINTS_FULL_SURFACE: bool = False
+    
+    __slots__ = ('_config', '_next_scene', '_scene_data')
+    
     def __init__(self, config: Config) -> None:
         """Initialize the scene.
         
@@ -24,7 +34,7 @@ class Scene(ABC):
         """
         self._config = config
         self._next_scene: Optional[str] = None
-        self._scene_data: Dict[str, Any] = {}
+        self._scene_data: Mapping[str, Any] = {}
         
     @abstractmethod
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -44,14 +54,28 @@ class Scene(ABC):
         pass
         
     @abstractmethod
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """Draw the scene.
         
         Args:
             surface: Surface to draw on
+            
+        Returns:
+            Optional[List[pygame.Rect]]: Areas changed by this frame, an empty list if
+            nothing changed, or None if the whole surface must be presented
         """
         pass
         
+    def invalidate(self) -> None:
+        """Make the next draw repaint the whole scene.
+        
+        Called when the window contents were lost, for example after the window
+        was uncovered. Scenes that skip drawing unchanged frames must override
+        this to repaint everything on their next draw.
+        """
+        # Default implementation does nothing
+        pass
+        
     def on_window_resize(self, width: int, height: int) -> None:
         """Handle window resize event.
         
@@ -73,21 +97,23 @@ class Scene(ABC):
         """
         return self._next_scene
         
-    def get_scene_data(self) -> Dict[str, Any]:
+    def get_scene_data(self) -> Mapping[str, Any]:
         """Get data to pass to the next scene.
         
         Returns:
-            Dict[str, Any]: Data to pass to the next scene
+            Mapping[str, Any]: Read-only view of the data to pass to the next scene
         """
-        return self._scene_data.copy()
+        return MappingProxyType(self._scene_data)
         
-    def set_scene_data(self, data: Dict[str, Any]) -> None:
+    def set_scene_data(self, data: Mapping[str, Any]) -> None:
         """Set data received from the previous scene.
         
+        The mapping is kept by reference, not copied, and must be treated as read-only.
+        
         Args:
             data: Data received from the previous scene
         """
-        self._scene_data = data.copy()
+        self._scene_data = data
         
     def reset(self) -> None:
         """Reset the scene state.
@@ -1,6 +1,19 @@
-from typing import Dict, Type, Optional
+from typing import Callable, Dict, List, Tuple, Type, Optional
 from .scene import Scene
 from config import Config
+import pygame
+
+# Events the game loop itself handles, so they are never blocked. Expose events
+# tell it to repaint after the window was uncovered.
+_ALWAYS_ALLOWED_EVENTS = (
+    pygame.QUIT, pygame.VIDEORESIZE, pygame.KEYDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED
+)
+
+# Events no scene handles, so they are kept out of the queue even when a scene wants everything else
+_NEVER_USED_EVENTS = (
+    pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP,
+    pygame.JOYHATMOTION, pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED, pygame.TEXTEDITING
+)
 
 class SceneManager:
     """Manages game scenes and transitions between them.
@@ -17,6 +30,12 @@ class SceneManager:
         _current_scene: Currently active scene instance
         _current_scene_name: Name of the currently active scene
         _needs_redraw: Flag indicating if the scene needs a full redraw
+        _pending_resize: Latest window size not yet applied to the current scene
+        _dirty_rects: Areas changed by the last draw, or None for the whole surface
+        _current_handle_event: Bound handle_event of the current scene
+        _current_update: Bound update of the current scene
+        _current_draw: Bound draw of the current scene
+        _current_get_next_scene: Bound get_next_scene of the current scene
     """
     
     def __init__(self, config: Config) -> None:
@@ -30,6 +49,14 @@ class SceneManager:
         self._current_scene: Optional[Scene] = None
         self._current_scene_name: Optional[str] = None
         self._needs_redraw: bool = True
+        self._dirty_rects: Optional[List] = None
+        self._pending_resize: Optional[Tuple[int, int]] = None
+        # Bound methods of the current scene, looked up once per scene change
+        # instead of on every event and frame
+        self._current_handle_event: Optional[Callable] = None
+        self._current_update: Optional[Callable] = None
+        self._current_draw: Optional[Callable] = None
+        self._current_get_next_scene: Optional[Callable] = None
         
     def register_scene(self, name: str, scene_class: Type[Scene]) -> None:
         """Register a new scene type.
@@ -59,27 +86,48 @@ class SceneManager:
             raise ValueError(f"Scene '{name}' not registered")
             
         # Create new scene instance
-        self._current_scene = self._scenes[name](self._config)
+        scene = self._current_scene = self._scenes[name](self._config)
+        self._apply_event_filter(scene)
         self._current_scene_name = name
         self._needs_redraw = True
+        self._current_handle_event = scene.handle_event
+        self._current_update = scene.update
+        self._current_draw = scene.draw
+        self._current_get_next_scene = scene.get_next_scene
         
         # Pass data to scene if provided
         if data:
             self._current_scene.set_scene_data(data)
             
+    def _apply_event_filter(self, scene: Scene) -> None:
+        """Only let the event types the scene handles into the event queue.
+        
+        Scenes without WANTED_EVENT_TYPES receive everything except _NEVER_USED_EVENTS.
+        
+        Args:
+            scene: Scene that is becoming active
+        """
+        wanted = scene.WANTED_EVENT_TYPES
+        if wanted is None:
+            pygame.event.set_allowed(None)
+            pygame.event.set_blocked(list(_NEVER_USED_EVENTS))
+            return
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(_ALWAYS_ALLOWED_EVENTS + tuple(wanted)))
+            
     def handle_window_resize(self, width: int, height: int) -> None:
         """Handle window resize event.
         
-        This method ensures the current scene layout is updated when
-        the window size changes.
+        Dragging a window edge can deliver many resize events per frame, so only
+        the latest size is recorded here and the scene layout is updated once
+        in the next update().
         
         Args:
             width: New window width
             height: New window height
         """
         if self._current_scene:
-            # Force the scene to update its layout based on new dimensions
-            self._current_scene.on_window_resize(width, height)
+            self._pending_resize = (width, height)
             self._needs_redraw = True
             
     def handle_event(self, event) -> None:
@@ -88,19 +136,24 @@ class SceneManager:
         Args:
             event: Pygame event to handle
         """
-        if self._current_scene:
-            self._current_scene.handle_event(event)
+        if self._current_handle_event is not None:
+            self._current_handle_event(event)
             
             # Check for scene transition
-            next_scene = self._current_scene.get_next_scene()
+            next_scene = self._current_get_next_scene()
             if next_scene:
                 scene_data = self._current_scene.get_scene_data()
                 self.set_scene(next_scene, scene_data)
                 
     def update(self) -> None:
         """Update the current scene."""
-        if self._current_scene:
-            self._current_scene.update()
+        if self._current_update is not None:
+            if self._pending_resize is not None:
+                # Force the scene to update its layout based on new dimensions
+                width, height = self._pending_resize
+                self._pending_resize = None
+                self._current_scene.on_window_resize(width, height)
+            self._current_update()
             
     def draw(self, surface) -> None:
         """Draw the current scene.
@@ -108,13 +161,36 @@ class SceneManager:
         Args:
             surface: Surface to draw on
         """
-        if self._current_scene:
+        if self._current_draw is not None:
             # If we need a full redraw, clear the surface first
-            if self._needs_redraw:
-                surface.fill((0, 0, 0))  # Clear with black
+            full_redraw = self._needs_redraw
+            if full_redraw:
+                # Scenes that paint every pixel themselves make the clear redundant
+                if not self._current_scene.PAINTS_FULL_SURFACE:
+                    surface.fill((0, 0, 0))  # Clear with black
                 self._needs_redraw = False
                 
-            self._current_scene.draw(surface)
+            dirty_rects = self._current_draw(surface)
+            self._dirty_rects = None if full_redraw else dirty_rects
+            
+    def force_redraw(self) -> None:
+        """Clear and repaint the whole display on the next draw.
+        
+        Scenes that only draw what changed are invalidated too, so they paint
+        every part of the screen again.
+        """
+        self._needs_redraw = True
+        if self._current_scene is not None:
+            self._current_scene.invalidate()
+            
+    def get_dirty_rects(self) -> Optional[List]:
+        """Get the areas changed by the last draw.
+        
+        Returns:
+            Optional[List]: Changed rects to pass to pygame.display.update, or None
+            if the whole display must be flipped
+        """
+        return self._dirty_rects
             
     @property
     def current_scene_name(self) -> Optional[str]:
@@ -1,5 +1,5 @@
 from .title_screen import TitleScreen
 from .options_screen import OptionsScreen
-from .game_screen import GameScreen
+from .game_screen import GameScreen, preload_game_map
 
-__all__ = ['TitleScreen', 'OptionsScreen', 'GameScreen'] 
\ No newline at end of file
+__all__ = ['TitleScreen', 'OptionsScreen', 'GameScreen', 'preload_game_map'] 
\ No newline at end of file
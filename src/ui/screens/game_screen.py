@@ -1,12 +1,47 @@
 import pygame
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
 from ..core.scene import Scene
 from ..components import Button, LoadingScreen
-from ..style.style_manager import StyleManager, FontSize
-from map.map_manager import MapManager
+from ..style.style_manager import StyleManager
 from biome.biome_loader import BiomeLoader
 from biome.biome_map import BiomeMap
 
+# Map generation runs here so the frame loop keeps drawing the loading screen
+_MAP_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-generation")
+
+# Map generated ahead of time by preload_game_map, taken by the next GameScreen
+_preloaded_map: Optional[Future] = None
+
+def _generate_map(width: int, height: int) -> Tuple[BiomeMap, Tuple[int, int]]:
+    """Load the biomes and build a map for a window size.
+    
+    Args:
+        width: Window width the map is laid out for
+        height: Window height the map is laid out for
+        
+    Returns:
+        Tuple[BiomeMap, Tuple[int, int]]: The map and the window size it was built for
+    """
+    biome_loader = BiomeLoader()
+    biome_loader.load()
+    biome_map = BiomeMap(biome_loader.biomes)
+    biome_map.update_screen_size(width, height)
+    return biome_map, (width, height)
+
+def preload_game_map(config) -> None:
+    """Start generating the game map in the background before the game screen is opened.
+    
+    The map is built while the player is still on the title screen, so starting
+    a game usually skips the loading screen.
+    
+    Args:
+        config: Game configuration object
+    """
+    global _preloaded_map
+    if _preloaded_map is None:
+        _preloaded_map = _MAP_EXECUTOR.submit(_generate_map, *config.get_window_dimensions())
+
 class GameScreen(Scene):
     """Game screen scene.
     
@@ -23,56 +58,74 @@ class GameScreen(Scene):
         """
         super().__init__(config)
         self._style = StyleManager.get_instance().get_style()
-        self._biome_loader = BiomeLoader()
         self._biome_map: Optional[BiomeMap] = None
         self._menu_button: Optional[Button] = None
-        self._loading_screen = LoadingScreen(message="Generating map... Please wait")
+        self._loading_screen = LoadingScreen.get_instance()
+        self._loading_screen.set_message("Generating map... Please wait")
         self._map_initialized = False
+        self._map_future: Optional[Future] = None
         self._setup_ui()
         
     def _setup_ui(self) -> None:
         """Setup the game screen UI components."""
+        # Create menu button, positioned by _layout_ui
+        self._menu_button = Button(
+            x=0,
+            y=0,
+            width=0,
+            height=0,
+            text="Menu",
+            action=self._on_menu_clicked,
+            color_type="secondary",
+            hover_color_type="hover",
+            text_color_type="text"
+        )
+        self._layout_ui()
+        
+    def _layout_ui(self) -> None:
+        """Position the existing UI components for the current window size."""
         # Get current window dimensions
         width, height = self._config.get_window_dimensions()
+        self._bg_color = self._style.get_color("background")
         
         # Calculate dimensions relative to window size
         button_width = min(width // 8, 100)
         button_height = min(height // 16, 40)
         margin = min(width, height) // 60  # Responsive margin
         
-        # Create menu button - position in top-left with responsive margin
-        self._menu_button = Button(
-            x=margin,
-            y=margin,
-            width=button_width,
-            height=button_height,
-            text="Menu",
-            action=self._on_menu_clicked,
-            color_type="secondary",
-            hover_color_type="hover",
-            text_color_type="text"
-        )
+        # Keep the menu button in the top-left with responsive margin
+        self._menu_button.rect.update(margin, margin, button_width, button_height)
         
     def _on_menu_clicked(self) -> None:
         """Handle menu button click event."""
         self._next_scene = "title"
         
     def _initialize_map(self) -> None:
-        """Initialize the biome map if not already done."""
-        def map_generation_task():
-            """Task for generating the map in a separate thread."""
-            self._biome_loader.load()
-            self._biome_map = BiomeMap(self._biome_loader.biomes)
-            # Update map dimensions with current window size
-            width, height = self._config.get_window_dimensions()
-            self._biome_map.update_screen_size(width, height)
-            
-        def on_map_generated():
-            """Callback when map generation is complete."""
-            self._map_initialized = True
-            
-        # Start the map generation with loading screen
-        self._loading_screen.start_task(map_generation_task, on_map_generated)
+        """Start generating the biome map in the background, or take the preloaded one."""
+        global _preloaded_map
+        future, _preloaded_map = _preloaded_map, None
+        if future is None:
+            future = _MAP_EXECUTOR.submit(_generate_map, *self._config.get_window_dimensions())
+        self._map_future = future
+        # A finished preload is published in the same update, so the loading screen never shows
+        if not future.done():
+            self._loading_screen.show()
+        
+    def _publish_map(self) -> None:
+        """Install the generated map on the main thread.
+        
+        Raises:
+            Exception: Any exception raised while generating the map
+        """
+        future, self._map_future = self._map_future, None
+        self._loading_screen.hide()
+        biome_map, generated_size = future.result()
+        # The window may have been resized while the map was generated
+        current_size = self._config.get_window_dimensions()
+        if generated_size != current_size:
+            biome_map.update_screen_size(*current_size)
+        self._biome_map = biome_map
+        self._map_initialized = True
         
     def on_window_resize(self, width: int, height: int) -> None:
         """Handle window resize event.
@@ -82,7 +135,7 @@ class GameScreen(Scene):
             height: New window height
         """
         # Update UI components for new window size
-        self._setup_ui()
+        self._layout_ui()
         # Update map dimensions if it exists
         if self._biome_map:
             self._biome_map.update_screen_size(width, height)
@@ -97,12 +150,6 @@ class GameScreen(Scene):
         if self._loading_screen.is_visible():
             return
             
-        if event.type == pygame.VIDEORESIZE:
-            # Update UI components for new window size
-            self._setup_ui()
-            if self._biome_map:
-                self._biome_map.update_screen_size(event.w, event.h)
-                
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self._menu_button and self._menu_button.is_clicked(event.pos):
                 self._menu_button.on_click()
@@ -113,9 +160,13 @@ class GameScreen(Scene):
     def update(self) -> None:
         """Update the game screen state."""
         # Initialize map if not already done
-        if not self._map_initialized and not self._loading_screen.is_visible():
+        if not self._map_initialized and self._map_future is None:
             self._initialize_map()
             
+        # Publish the map once its generation finished
+        if self._map_future is not None and self._map_future.done():
+            self._publish_map()
+            
         # Update loading screen animation
         self._loading_screen.update()
             
@@ -125,11 +176,16 @@ class GameScreen(Scene):
         Args:
             surface: Surface to draw on
         """
-        # Draw background
-        surface.fill(self._style.get_color("background"))
+        map_visible = self._biome_map is not None and not self._loading_screen.is_visible()
+        
+        # Draw background, only where the map does not cover the surface
+        if map_visible:
+            self._fill_around(surface, self._biome_map.get_rect())
+        else:
+            surface.fill(self._bg_color)
         
         # Draw map if initialized
-        if self._biome_map and not self._loading_screen.is_visible():
+        if map_visible:
             self._biome_map.draw(surface)
             
         # Draw UI components
@@ -139,8 +195,37 @@ class GameScreen(Scene):
         # Draw loading screen if visible
         self._loading_screen.draw(surface)
             
+    def _fill_around(self, surface: pygame.Surface, covered: pygame.Rect) -> None:
+        """Fill the background outside of an area that is drawn over anyway.
+        
+        Args:
+            surface: Surface to draw on
+            covered: Area that will be fully painted afterwards
+        """
+        surface_rect = surface.get_rect()
+        covered = covered.clip(surface_rect)
+        if covered == surface_rect:
+            return
+        if not covered:
+            surface.fill(self._bg_color)
+            return
+            
+        # Strips above and below span the full width, strips left and right fill the gap between them
+        strips = (
+            pygame.Rect(0, 0, surface_rect.width, covered.top),
+            pygame.Rect(0, covered.bottom, surface_rect.width, surface_rect.height - covered.bottom),
+            pygame.Rect(0, covered.top, covered.left, covered.height),
+            pygame.Rect(covered.right, covered.top, surface_rect.width - covered.right, covered.height)
+        )
+        for strip in strips:
+            if strip:
+                surface.fill(self._bg_color, strip)
+            
     def reset(self) -> None:
         """Reset the game screen state."""
         super().reset()
         self._biome_map = None
-        self._map_initialized = False 
\ No newline at end of file
+        self._map_initialized = False
+        self._map_future = None
+        # The loading screen is shared with other scenes, so it is only hidden
+        self._loading_screen.hide()
@@ -1,10 +1,14 @@
 import pygame
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from ..core.scene import Scene
-from ..components import UIComponent
+from ..components import UIComponent, Slider
+from ..components._fonts import to_display_format
 from ..style.style_manager import StyleManager, FontSize
 from config import Config
 
+# Surface.fblits is only provided by some pygame builds
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 class Menu(Scene):
     """A menu scene that can contain multiple UI components.
     
@@ -12,6 +16,11 @@ class Menu(Scene):
     in-game menus like pause menu, settings menu, etc.
     """
     
+    __slots__ = (
+        '_style', '_components', '_visible', '_padding', '_bg_rect', '_bg_dirty', '_mouse_pos',
+        '_style_manager', '_bg_surface', '_bg_key'
+    )
+    
     def __init__(self, config: Config) -> None:
         """Initialize the menu.
         
@@ -19,10 +28,18 @@ class Menu(Scene):
             config: Game configuration object
         """
         super().__init__(config)
-        self._style = StyleManager.get_instance().get_style()
+        self._style_manager = StyleManager.get_instance()
+        self._style = self._style_manager.get_style()
         self._components: List[UIComponent] = []
         self._visible = True
         self._padding = 20
+        self._bg_rect: Optional[pygame.Rect] = None
+        self._bg_dirty = True
+        # Pre-rendered background, redrawn when its size or the style changes
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._bg_key: Optional[Tuple[Tuple[int, int], int]] = None
+        # Latest mouse position not yet applied to the components
+        self._mouse_pos: Optional[Tuple[int, int]] = None
         
     def add_component(self, component: UIComponent) -> None:
         """Add a UI component to the menu.
@@ -31,6 +48,42 @@ class Menu(Scene):
             component: The UI component to add
         """
         self._components.append(component)
+        self._bg_dirty = True
+        
+    def invalidate_layout(self) -> None:
+        """Recompute the menu background on the next draw.
+        
+        Call this after moving or resizing components from outside the menu.
+        """
+        self._bg_dirty = True
+        
+    def _recompute_bg(self) -> None:
+        """Compute the padded background rect around all components."""
+        self._bg_dirty = False
+        if not self._components:
+            self._bg_rect = None
+            return
+            
+        # Calculate background dimensions and add padding
+        self._bg_rect = self._component_bounds().inflate(self._padding * 2, self._padding * 2)
+        
+    def _render_bg(self) -> None:
+        """Draw the background fill and border into the cached surface."""
+        style = self._style
+        # Fill and border cover every pixel, so the surface needs no alpha
+        bg_surface = pygame.Surface(self._bg_rect.size)
+        bg_surface.fill(style.surface)
+        pygame.draw.rect(bg_surface, style.border, bg_surface.get_rect(), 2)
+        self._bg_surface = to_display_format(bg_surface, alpha=False)
+        
+    def _component_bounds(self) -> pygame.Rect:
+        """Get the rect enclosing all components.
+        
+        Returns:
+            pygame.Rect: Union of all component rects
+        """
+        first, *rest = self._components
+        return first.rect.unionall([comp.rect for comp in rest])
         
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events.
@@ -41,18 +94,35 @@ class Menu(Scene):
         if not self._visible:
             return
             
-        if event.type == pygame.VIDEORESIZE:
-            # Update components for new window size
-            self._update_component_positions(event.w, event.h)
+        if event.type == pygame.MOUSEMOTION:
+            # Motion events arrive in bursts, so only the latest position is kept
+            # and applied once per frame in update()
+            self._mouse_pos = event.pos
+            return
             
+        # Clicks must see the hover and drag state of the latest mouse position
+        self._apply_mouse_pos()
         for component in self._components:
             component.handle_event(event)
             
+    def _apply_mouse_pos(self) -> None:
+        """Update hover states and dragged sliders from the latest mouse position."""
+        pos = self._mouse_pos
+        if pos is None:
+            return
+        self._mouse_pos = None
+        
+        for component in self._components:
+            if isinstance(component, Slider):
+                component.drag_to(pos[0])
+            component.update_hover(pos)
+            
     def update(self) -> None:
         """Update the menu state."""
         if not self._visible:
             return
             
+        self._apply_mouse_pos()
         for component in self._components:
             component.update()
             
@@ -66,27 +136,36 @@ class Menu(Scene):
             return
             
         # Draw background if there are components
-        if self._components:
-            # Calculate background dimensions
-            min_x = min(comp.rect.left for comp in self._components)
-            max_x = max(comp.rect.right for comp in self._components)
-            min_y = min(comp.rect.top for comp in self._components)
-            max_y = max(comp.rect.bottom for comp in self._components)
+        if self._bg_dirty:
+            self._recompute_bg()
+        if self._bg_rect is not None:
+            bg_key = (self._bg_rect.size, self._style_manager.version)
+            if bg_key != self._bg_key:
+                self._bg_key = bg_key
+                self._render_bg()
+            surface.blit(self._bg_surface, self._bg_rect)
             
-            # Add padding
-            bg_rect = pygame.Rect(
-                min_x - self._padding,
-                min_y - self._padding,
-                max_x - min_x + self._padding * 2,
-                max_y - min_y + self._padding * 2
-            )
-            
-            # Draw menu background
-            pygame.draw.rect(surface, self._style.get_color("surface"), bg_rect)
-            pygame.draw.rect(surface, self._style.get_color("border"), bg_rect, 2)
-            
-        # Draw components
+        # Blit components that are a single cached surface in one batch,
+        # skipping the ones entirely outside the clip area
+        clip = surface.get_clip()
+        pairs = []
+        custom = []
         for component in self._components:
+            bounds = component.get_draw_bounds()
+            if bounds is not None and not clip.colliderect(bounds):
+                continue
+            pair = component.get_blit_pair()
+            if pair is not None:
+                pairs.append(pair)
+            else:
+                custom.append(component)
+        if _HAS_FBLITS:
+            surface.fblits(pairs)
+        else:
+            surface.blits(pairs, doreturn=False)
+            
+        # Draw the remaining components individually
+        for component in custom:
             component.draw(surface)
             
     def _update_component_positions(self, width: int, height: int) -> None:
@@ -98,24 +177,39 @@ class Menu(Scene):
         """
         # Center the menu in the window
         if self._components:
-            # Calculate total menu dimensions
-            min_x = min(comp.rect.left for comp in self._components)
-            max_x = max(comp.rect.right for comp in self._components)
-            min_y = min(comp.rect.top for comp in self._components)
-            max_y = max(comp.rect.bottom for comp in self._components)
+            # Calculate total menu dimensions, reusing the background rect while it is current
+            if self._bg_dirty:
+                bounds = self._component_bounds()
+            else:
+                bounds = self._bg_rect.inflate(-self._padding * 2, -self._padding * 2)
+            min_x, min_y = bounds.topleft
             
-            menu_width = max_x - min_x + self._padding * 2
-            menu_height = max_y - min_y + self._padding * 2
+            menu_width = bounds.width + self._padding * 2
+            menu_height = bounds.height + self._padding * 2
             
             # Calculate offset to center the menu
             offset_x = (width - menu_width) // 2
             offset_y = (height - menu_height) // 2
             
             # Update component positions
+            dx = offset_x - min_x + self._padding
+            dy = offset_y - min_y + self._padding
             for component in self._components:
-                component.rect.x += offset_x - min_x + self._padding
-                component.rect.y += offset_y - min_y + self._padding
+                component.rect.move_ip(dx, dy)
+            # Every component moved by the same offset, so the background only needs shifting
+            if not self._bg_dirty:
+                self._bg_rect.move_ip(dx, dy)
                 
+    def on_window_resize(self, width: int, height: int) -> None:
+        """Handle window resize event.
+        
+        Args:
+            width: New window width
+            height: New window height
+        """
+        # Keep the menu centered in the resized window
+        self._update_component_positions(width, height)
+        
     def show(self) -> None:
         """Show the menu."""
         self._visible = True
@@ -128,4 +222,5 @@ class Menu(Scene):
         """Reset the menu state."""
         super().reset()
         self._components.clear()
+        self._bg_dirty = True
         self._visible = True 
\ No newline at end of file
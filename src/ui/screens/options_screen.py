@@ -1,10 +1,15 @@
 import pygame
-from typing import Dict, Optional
+import numpy as np
+from typing import Dict, List, Optional
 from ..core.scene import Scene
 from ..components import Button
+from ..components._fonts import to_display_format
 from ..style.style_manager import StyleManager, FontSize, ColorPalette
 from config import Config
 
+# Surface.fblits is only provided by some pygame builds
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 class OptionsScreen(Scene):
     """Options screen scene for selecting game styles/themes.
     
@@ -12,6 +17,15 @@ class OptionsScreen(Scene):
     and color themes for the game.
     """
     
+    # Buttons are only clicked, so motion events are never needed here
+    WANTED_EVENT_TYPES = (pygame.MOUSEBUTTONDOWN,)
+    
+    __slots__ = (
+        '_style', '_theme_buttons', '_back_button', '_button_ys', '_center_x',
+        '_title_surface', '_title_rect', '_subtitle_surface', '_subtitle_rect', '_needs_redraw',
+        '_bg_color', '_w', '_h', '_buttons', '_button_bounds'
+    )
+    
     def __init__(self, config: Config) -> None:
         """Initialize the options screen.
         
@@ -25,18 +39,12 @@ class OptionsScreen(Scene):
         
     def _setup_ui(self) -> None:
         """Setup the options screen UI."""
-        # Calculate dimensions
-        width, height = self._config.get_window_dimensions()
-        button_width = min(width // 4, 200)
-        button_height = min(height // 12, 50)
-        spacing = height // 36
-        
         # Create back button
         self._back_button = Button(
-            x=20,
-            y=20,
-            width=button_width,
-            height=button_height,
+            x=0,
+            y=0,
+            width=0,
+            height=0,
             text="Back",
             action=self._on_back_clicked,
             color_type="secondary",
@@ -45,15 +53,12 @@ class OptionsScreen(Scene):
         )
         
         # Create theme selection buttons
-        start_y = height // 3
-        current_y = start_y
-        
         for theme in ColorPalette:
             button = Button(
-                x=(width - button_width) // 2,
-                y=current_y,
-                width=button_width,
-                height=button_height,
+                x=0,
+                y=0,
+                width=0,
+                height=0,
                 text=theme.name.capitalize(),
                 action=lambda t=theme: self._on_theme_selected(t),
                 color_type="primary" if theme == self._config.theme else "secondary",
@@ -61,7 +66,60 @@ class OptionsScreen(Scene):
                 text_color_type="text"
             )
             self._theme_buttons[theme.name] = button
-            current_y += button_height + spacing
+            
+        self._collect_buttons()
+        self._layout_ui()
+        
+    def _collect_buttons(self) -> None:
+        """Gather the buttons for batched drawing and hit-testing."""
+        self._buttons: List[Button] = [self._back_button, *self._theme_buttons.values()]
+        # Left, top, right and bottom edge of each button
+        self._button_bounds = np.zeros((len(self._buttons), 4), dtype=np.int32)
+        self._update_button_bounds()
+        
+    def _update_button_bounds(self) -> None:
+        """Copy the button rects into the hit-test array after they moved."""
+        self._button_bounds[:] = [
+            (rect.left, rect.top, rect.right, rect.bottom) for rect in (button.rect for button in self._buttons)
+        ]
+        
+    def _layout_ui(self) -> None:
+        """Position the existing buttons and texts for the current window size."""
+        # Calculate dimensions, kept for the texts re-rendered on theme changes
+        width, height = self._w, self._h = self._config.get_window_dimensions()
+        button_width = min(width // 4, 200)
+        button_height = min(height // 12, 50)
+        spacing = height // 36
+        
+        self._back_button.rect.update(20, 20, button_width, button_height)
+        
+        # Theme buttons form one evenly spaced column
+        start_y = height // 3
+        self._button_ys = start_y + np.arange(len(self._theme_buttons), dtype=np.int32) * (button_height + spacing)
+        # Every theme button shares one horizontally centered x
+        self._center_x = (width - button_width) // 2
+        for button, y in zip(self._theme_buttons.values(), self._button_ys.tolist()):
+            button.rect.update(self._center_x, y, button_width, button_height)
+        self._update_button_bounds()
+            
+        self._build_static_surfaces()
+        self._needs_redraw = True
+        
+    def _build_static_surfaces(self) -> None:
+        """Pre-render the title and subtitle and cache the background color for the current style."""
+        width, height = self._w, self._h
+        self._bg_color = self._style.get_color("background")
+        
+        title_font = self._style.get_font(FontSize.TITLE)
+        self._title_surface = title_font.render("Style Selector", True, self._style.get_color("text"))
+        self._title_rect = self._title_surface.get_rect(center=(width // 2, height // 6))
+        
+        subtitle_font = self._style.get_font(FontSize.BODY)
+        self._subtitle_surface = subtitle_font.render("Select a theme:", True, self._style.get_color("text_secondary"))
+        self._subtitle_rect = self._subtitle_surface.get_rect(center=(width // 2, height // 4))
+        # Match the display format once so repaints need no conversion
+        self._title_surface = to_display_format(self._title_surface)
+        self._subtitle_surface = to_display_format(self._subtitle_surface)
             
     def _on_back_clicked(self) -> None:
         """Handle back button click."""
@@ -82,6 +140,10 @@ class OptionsScreen(Scene):
         # Update button states
         for name, button in self._theme_buttons.items():
             button.color_type = "primary" if ColorPalette[name] == theme else "secondary"
+            
+        # Text colors come from the palette
+        self._build_static_surfaces()
+        self._needs_redraw = True
         
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events.
@@ -89,56 +151,62 @@ class OptionsScreen(Scene):
         Args:
             event: Pygame event to handle
         """
-        if event.type == pygame.VIDEORESIZE:
-            # Update UI for new window size
-            self._setup_ui()
+        # Only left clicks do anything here; key events still arrive despite
+        # WANTED_EVENT_TYPES, and window resizes arrive through on_window_resize
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return
             
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self._back_button.is_clicked(event.pos):
-                self._back_button.on_click()
+        # Test the click against every button at once; buttons do not overlap,
+        # so at most one of them is hit
+        px, py = event.pos
+        bounds = self._button_bounds
+        hits = (bounds[:, 0] <= px) & (px < bounds[:, 2]) & (bounds[:, 1] <= py) & (py < bounds[:, 3])
+        if hits.any():
+            self._buttons[int(hits.argmax())].on_click()
                 
-            for button in self._theme_buttons.values():
-                if button.is_clicked(event.pos):
-                    button.on_click()
-                    
     def update(self) -> None:
         """Update the options screen state."""
         pass
         
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """Draw the options screen.
         
         Args:
             surface: Surface to draw on
+            
+        Returns:
+            Optional[List[pygame.Rect]]: None after a repaint, or an empty list when
+            the screen has not changed since the last frame
         """
-        width, height = self._config.get_window_dimensions()
+        # The screen only changes on layout or theme changes
+        if not self._needs_redraw:
+            return []
+        self._needs_redraw = False
         
         # Draw background
-        surface.fill(self._style.get_color("background"))
-        
-        # Draw title
-        title_font = self._style.get_font(FontSize.TITLE)
-        title_text = title_font.render("Style Selector", True, self._style.get_color("text"))
-        title_rect = title_text.get_rect(center=(width // 2, height // 6))
-        surface.blit(title_text, title_rect)
-        
-        # Draw subtitle
-        subtitle_font = self._style.get_font(FontSize.BODY)
-        subtitle_text = subtitle_font.render("Select a theme:", True, self._style.get_color("text_secondary"))
-        subtitle_rect = subtitle_text.get_rect(center=(width // 2, height // 4))
-        surface.blit(subtitle_text, subtitle_rect)
-        
-        # Draw back button
-        self._back_button.draw(surface)
-        
-        # Draw theme buttons
-        for button in self._theme_buttons.values():
-            button.draw(surface)
+        surface.fill(self._bg_color)
+        
+        # Draw title and subtitle
+        surface.blit(self._title_surface, self._title_rect)
+        surface.blit(self._subtitle_surface, self._subtitle_rect)
+        
+        # Draw back and theme buttons in one batch
+        pairs = [pair for pair in (button.get_blit_pair() for button in self._buttons) if pair is not None]
+        if _HAS_FBLITS:
+            surface.fblits(pairs)
+        else:
+            surface.blits(pairs, doreturn=False)
+        return None
             
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next draw."""
+        self._needs_redraw = True
+        
     def reset(self) -> None:
         """Reset the options screen state."""
         super().reset()
         self._theme_buttons.clear()
+        self._collect_buttons()
 
     def on_window_resize(self, width: int, height: int) -> None:
         """Handle window resize event.
@@ -147,5 +215,5 @@ class OptionsScreen(Scene):
             width: New window width
             height: New window height
         """
-        # Update UI layout for new window size
-        self._setup_ui() 
\ No newline at end of file
+        # Reposition the existing buttons for the new window size
+        self._layout_ui() 
\ No newline at end of file
@@ -1,9 +1,23 @@
 import pygame
-from typing import Optional, Callable
+from dataclasses import dataclass
+from typing import Optional, Callable, List, Tuple
 from ..core.scene import Scene
 from ..components import Button
+from ..components._fonts import to_display_format
 from ..style.style_manager import StyleManager, FontSize
-import sys
+
+# Surface.fblits is only provided by some pygame builds
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+@dataclass
+class ButtonLayout:
+    """Geometry of an evenly spaced column of equally sized buttons."""
+    __slots__ = ('x', 'ys', 'width', 'height', 'stride')
+    x: int
+    ys: Tuple[int, ...]
+    width: int
+    height: int
+    stride: int
 
 class TitleScreen(Scene):
     """Title screen scene.
@@ -11,6 +25,11 @@ class TitleScreen(Scene):
     This scene displays the game title and main menu options.
     """
     
+    # Buttons are hovered and clicked; everything else is filtered out of the queue
+    WANTED_EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION)
+    # Every layout change composes a window-sized background, so a full redraw covers the surface
+    PAINTS_FULL_SURFACE = True
+    
     def __init__(self, config) -> None:
         """Initialize the title screen.
         
@@ -18,59 +37,102 @@ class TitleScreen(Scene):
             config: Game configuration
         """
         super().__init__(config)
-        self._style = StyleManager.get_instance().get_style()
-        self._setup_menu()
+        self._style_manager = StyleManager.get_instance()
+        self._style = self._style_manager.get_style()
+        # Fonts, buttons and texts are created on first use, so constructing the
+        # screen without showing it costs nothing
+        self._initialized = False
+        
+    def _ensure_initialized(self) -> None:
+        """Build the UI the first time the screen is drawn or receives an event."""
+        if not self._initialized:
+            self._initialized = True
+            self._build_ui()
+        
+    def _build_ui(self) -> None:
+        """Create the menu buttons once; they are positioned by _layout_ui."""
+        # Fonts do not change with the palette, so they are looked up once
+        self._title_font = self._style.get_font(FontSize.TITLE)
+        self._heading_font = self._style.get_font(FontSize.HEADING)
         
-    def _setup_menu(self) -> None:
-        """Setup or update the menu layout."""
-        # Calculate button dimensions
-        width, height = self._config.get_window_dimensions()
+        # Buttons from top to bottom; the column layout and the click dispatch both
+        # index into this tuple
+        self._buttons = tuple(
+            Button(
+                x=0,
+                y=0,
+                width=0,
+                height=0,
+                text=text,
+                action=action,
+                color_type=color_type,
+                hover_color_type="hover",
+                text_color_type="text"
+            )
+            for text, action, color_type in (
+                ("Start Game", self._on_start_clicked, "primary"),
+                ("Options", self._on_options_clicked, "secondary"),
+                ("Quit", self._on_quit_clicked, "accent")
+            )
+        )
+        # Index of the button under the mouse
+        self._hover_idx: Optional[int] = None
+        # Index of the hovered button when it was last drawn
+        self._prev_hover_idx: Optional[int] = None
+        self._layout_ui()
+        
+    def _layout_ui(self) -> None:
+        """Position the existing buttons and texts for the current window size."""
+        # Calculate button dimensions, keeping the size for the text cache
+        width, height = self._w, self._h = self._config.get_window_dimensions()
         button_width = min(width // 4, 200)
         button_height = min(height // 12, 50)
         spacing = height // 36
         
         # Calculate total height needed for all buttons
-        total_height = 3 * (button_height + spacing)
+        stride = button_height + spacing
+        total_height = len(self._buttons) * stride
         start_y = (height - total_height) // 2
         
-        # Create start button
-        self._start_button = Button(
+        # Buttons form one evenly spaced column, so hit-testing is a bounds check and a division
+        layout = self._button_layout = ButtonLayout(
             x=(width - button_width) // 2,
-            y=start_y,
+            ys=tuple(start_y + i * stride for i in range(len(self._buttons))),
             width=button_width,
             height=button_height,
-            text="Start Game",
-            action=self._on_start_clicked,
-            color_type="primary",
-            hover_color_type="hover",
-            text_color_type="text"
+            stride=stride
         )
+        for button, y in zip(self._buttons, layout.ys):
+            button.rect.update(layout.x, y, layout.width, layout.height)
+            
+        # Texts are re-rendered on theme changes too, around the same anchor
+        self._title_center = (width // 2, height // 4)
         
-        # Create options button
-        self._options_button = Button(
-            x=(width - button_width) // 2,
-            y=start_y + button_height + spacing,
-            width=button_width,
-            height=button_height,
-            text="Options",
-            action=self._on_options_clicked,
-            color_type="secondary",
-            hover_color_type="hover",
-            text_color_type="text"
-        )
+        self._rebuild_text_cache()
         
-        # Create quit button
-        self._quit_button = Button(
-            x=(width - button_width) // 2,
-            y=start_y + 2 * (button_height + spacing),
-            width=button_width,
-            height=button_height,
-            text="Quit",
-            action=self._on_quit_clicked,
-            color_type="accent",
-            hover_color_type="hover",
-            text_color_type="text"
-        )
+    def _rebuild_text_cache(self) -> None:
+        """Pre-render the title and subtitle for the current window size and style."""
+        self._style_version = self._style_manager.version
+        
+        self._title_surface = self._title_font.render("Project Fluorite", True, self._style.get_color("text"))
+        self._title_rect = self._title_surface.get_rect(center=self._title_center)
+        
+        self._subtitle_surface = self._heading_font.render("Explore and Discover", True,
+                                                           self._style.get_color("text_secondary"))
+        self._subtitle_rect = self._subtitle_surface.get_rect(center=(self._title_center[0],
+                                                                      self._title_rect.bottom + 20))
+        self._compose_static_bg()
+        
+    def _compose_static_bg(self) -> None:
+        """Compose the parts of the screen that never change into one window-sized surface."""
+        # Only the composed surface is blitted each frame, so it alone needs the display format
+        static_bg = to_display_format(pygame.Surface((self._w, self._h)), alpha=False)
+        # Black like the scene manager's clear, which used to show through
+        static_bg.fill((0, 0, 0))
+        static_bg.blit(self._title_surface, self._title_rect)
+        static_bg.blit(self._subtitle_surface, self._subtitle_rect)
+        self._static_bg = static_bg
+        self._needs_redraw = True
         
     def _on_start_clicked(self) -> None:
         """Handle start button click."""
@@ -83,7 +145,8 @@ class TitleScreen(Scene):
     def _on_quit_clicked(self) -> None:
         """Handle quit button click."""
         pygame.quit()
-        sys.exit()
+        # Same as sys.exit(0) without needing the sys module
+        raise SystemExit(0)
         
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle pygame events.
@@ -91,49 +154,97 @@ class TitleScreen(Scene):
         Args:
             event: Pygame event to handle
         """
-        if event.type == pygame.VIDEORESIZE:
-            # Update UI for new window size
-            self._setup_menu()
+        self._ensure_initialized()
+        if event.type == pygame.MOUSEMOTION:
+            pos = event.pos
+            hover_idx = self._button_index_at(pos[0], pos[1])
+            if hover_idx != self._hover_idx:
+                # Hover changes only switch which cached surface a button blits
+                if self._hover_idx is not None:
+                    self._buttons[self._hover_idx].is_hovered = False
+                if hover_idx is not None:
+                    self._buttons[hover_idx].is_hovered = True
+                self._hover_idx = hover_idx
+            return
+            
+        # Otherwise only left clicks do anything here; key events still arrive
+        # despite WANTED_EVENT_TYPES, and window resizes arrive through on_window_resize
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return
+            
+        pos = event.pos
+        index = self._button_index_at(pos[0], pos[1])
+        if index is not None:
+            self._buttons[index].on_click()
             
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self._start_button.is_clicked(event.pos):
-                self._start_button.on_click()
-            elif self._options_button.is_clicked(event.pos):
-                self._options_button.on_click()
-            elif self._quit_button.is_clicked(event.pos):
-                self._quit_button.on_click()
-                
+    def _button_index_at(self, mx: int, my: int) -> Optional[int]:
+        """Get the button under a point.
+        
+        Args:
+            mx: X coordinate of the point
+            my: Y coordinate of the point
+            
+        Returns:
+            Optional[int]: Index into the button tuple, or None if no button is there
+        """
+        layout = self._button_layout
+        y0 = layout.ys[0]
+        # Reject points outside the area enclosing all buttons right away
+        if not (layout.x <= mx < layout.x + layout.width and y0 <= my < layout.ys[-1] + layout.height):
+            return None
+        index, offset = divmod(my - y0, layout.stride)
+        return index if offset < layout.height else None
+        
     def update(self) -> None:
         """Update the title screen state."""
         pass
         
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
         """Draw the title screen.
         
         Args:
             surface: Surface to draw on
+            
+        Returns:
+            Optional[List[pygame.Rect]]: None after a full repaint, otherwise the
+            rects of the buttons whose hover state changed, which may be empty
         """
-        width, height = self._config.get_window_dimensions()
-        
-        # Draw title
-        title_font = self._style.get_font(FontSize.TITLE)
-        title_text = title_font.render("Project Fluorite", True, self._style.get_color("text"))
-        title_rect = title_text.get_rect(center=(width // 2, height // 4))
-        surface.blit(title_text, title_rect)
-        
-        # Draw subtitle
-        subtitle_font = self._style.get_font(FontSize.HEADING)
-        subtitle_text = subtitle_font.render("Explore and Discover", True, 
-                                           self._style.get_color("text_secondary"))
-        subtitle_rect = subtitle_text.get_rect(center=(width // 2, 
-                                                     title_rect.bottom + 20))
-        surface.blit(subtitle_text, subtitle_rect)
-        
-        # Draw all buttons
-        self._start_button.draw(surface)
-        self._options_button.draw(surface)
-        self._quit_button.draw(surface)
+        self._ensure_initialized()
+        
+        # Text colors come from the palette, so re-render them after a theme change
+        if self._style_manager.version != self._style_version:
+            self._rebuild_text_cache()
+            
+        hover_idx = self._hover_idx
+        prev_hover_idx, self._prev_hover_idx = self._prev_hover_idx, hover_idx
+        
+        if not self._needs_redraw:
+            # Only the hover state can change between layouts, and button surfaces are
+            # opaque, so redrawing the affected buttons is enough
+            if hover_idx == prev_hover_idx:
+                return []
+            changed = [self._buttons[i] for i in (prev_hover_idx, hover_idx) if i is not None]
+            for button in changed:
+                button.draw(surface)
+            return [button.rect for button in changed]
+        self._needs_redraw = False
+        
+        # Draw background, title and subtitle in one blit
+        surface.blit(self._static_bg, (0, 0))
+        
+        # Draw all buttons in one batch
+        pairs = [pair for pair in (button.get_blit_pair() for button in self._buttons) if pair is not None]
+        if _HAS_FBLITS:
+            surface.fblits(pairs)
+        else:
+            surface.blits(pairs, doreturn=False)
+        return None
 
+    def invalidate(self) -> None:
+        """Repaint the whole screen on the next draw."""
+        # Blits the pre-composed background again instead of only changed buttons
+        self._needs_redraw = True
+        
     def on_window_resize(self, width: int, height: int) -> None:
         """Handle window resize event.
         
@@ -141,5 +252,7 @@ class TitleScreen(Scene):
             width: New window width
             height: New window height
         """
-        # Update UI layout for new window size
-        self._setup_menu() 
\ No newline at end of file
+        # Reposition the existing buttons for the new window size; a screen that
+        # was not set up yet is laid out for the current size when it is
+        if self._initialized:
+            self._layout_ui() 
\ No newline at end of file
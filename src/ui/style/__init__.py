@@ -1,3 +1,3 @@
-from .style_manager import StyleManager, FontSize, ColorPalette
+from .style_manager import StyleManager, FontSize, ColorPalette, PaletteColors
 
-__all__ = ['StyleManager', 'FontSize', 'ColorPalette'] 
\ No newline at end of file
+__all__ = ['StyleManager', 'FontSize', 'ColorPalette', 'PaletteColors'] 
\ No newline at end of file
@@ -1,46 +1,61 @@
 import pygame
-from typing import Dict, Tuple, List, Optional
+from typing import Dict, NamedTuple, Tuple, List, Optional
 from enum import Enum
 
+RGB = Tuple[int, int, int]
+
+class PaletteColors(NamedTuple):
+    """Colors of one palette, read as attributes instead of by string key"""
+    background: RGB
+    surface: RGB
+    primary: RGB
+    secondary: RGB
+    accent: RGB
+    text: RGB
+    text_secondary: RGB
+    border: RGB
+    hover: RGB
+    disabled: RGB
+
 class ColorPalette(Enum):
-    DARK = {
-        "background": (20, 20, 20),
-        "surface": (30, 30, 30),
-        "primary": (41, 128, 185),  # Blue
-        "secondary": (39, 174, 96),  # Green
-        "accent": (231, 76, 60),    # Red
-        "text": (236, 240, 241),    # Light gray
-        "text_secondary": (189, 195, 199),  # Gray
-        "border": (44, 62, 80),     # Dark blue
-        "hover": (52, 152, 219),    # Light blue
-        "disabled": (127, 140, 141) # Gray
-    }
+    DARK = PaletteColors(
+        background=(20, 20, 20),
+        surface=(30, 30, 30),
+        primary=(41, 128, 185),  # Blue
+        secondary=(39, 174, 96),  # Green
+        accent=(231, 76, 60),    # Red
+        text=(236, 240, 241),    # Light gray
+        text_secondary=(189, 195, 199),  # Gray
+        border=(44, 62, 80),     # Dark blue
+        hover=(52, 152, 219),    # Light blue
+        disabled=(127, 140, 141) # Gray
+    )
     
-    LIGHT = {
-        "background": (236, 240, 241),
-        "surface": (189, 195, 199),
-        "primary": (52, 152, 219),  # Blue
-        "secondary": (46, 204, 113), # Green
-        "accent": (231, 76, 60),    # Red
-        "text": (44, 62, 80),       # Dark blue
-        "text_secondary": (52, 73, 94),  # Dark gray
-        "border": (149, 165, 166),  # Gray
-        "hover": (41, 128, 185),    # Dark blue
-        "disabled": (189, 195, 199) # Light gray
-    }
+    LIGHT = PaletteColors(
+        background=(236, 240, 241),
+        surface=(189, 195, 199),
+        primary=(52, 152, 219),  # Blue
+        secondary=(46, 204, 113), # Green
+        accent=(231, 76, 60),    # Red
+        text=(44, 62, 80),       # Dark blue
+        text_secondary=(52, 73, 94),  # Dark gray
+        border=(149, 165, 166),  # Gray
+        hover=(41, 128, 185),    # Dark blue
+        disabled=(189, 195, 199) # Light gray
+    )
     
-    MYSTICAL = {
-        "background": (44, 62, 80),
-        "surface": (52, 73, 94),
-        "primary": (155, 89, 182),  # Purple
-        "secondary": (26, 188, 156), # Turquoise
-        "accent": (230, 126, 34),   # Orange
-        "text": (236, 240, 241),    # Light gray
-        "text_secondary": (189, 195, 199),  # Gray
-        "border": (41, 128, 185),   # Blue
-        "hover": (142, 68, 173),    # Dark purple
-        "disabled": (127, 140, 141) # Gray
-    }
+    MYSTICAL = PaletteColors(
+        background=(44, 62, 80),
+        surface=(52, 73, 94),
+        primary=(155, 89, 182),  # Purple
+        secondary=(26, 188, 156), # Turquoise
+        accent=(230, 126, 34),   # Orange
+        text=(236, 240, 241),    # Light gray
+        text_secondary=(189, 195, 199),  # Gray
+        border=(41, 128, 185),   # Blue
+        hover=(142, 68, 173),    # Dark purple
+        disabled=(127, 140, 141) # Gray
+    )
 
 class FontSize(Enum):
     TITLE = 48
@@ -50,29 +65,42 @@ class FontSize(Enum):
     TINY = 14
 
 class UIStyle:
+    # Fonts do not depend on the palette, so every style shares them. Each size
+    # is loaded the first time it is requested.
+    fonts: Dict[FontSize, pygame.font.Font] = {}
+    
     def __init__(self, palette: ColorPalette = ColorPalette.DARK):
-        self.palette = palette
-        self.colors = palette.value
-        self.fonts: Dict[FontSize, pygame.font.Font] = {}
-        self._load_fonts()
-        
-    def _load_fonts(self):
-        """Load all required fonts with different sizes"""
-        for size in FontSize:
-            self.fonts[size] = pygame.font.Font(None, size.value)
+        self.set_palette(palette)
             
     def get_font(self, size: FontSize) -> pygame.font.Font:
         """Get a font of the specified size"""
-        return self.fonts[size]
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size.value)
+        return font
         
     def get_color(self, color_name: str) -> Tuple[int, int, int]:
         """Get a color from the current palette"""
-        return self.colors[color_name]
+        return getattr(self.colors, color_name)
         
     def set_palette(self, palette: ColorPalette):
         """Change the current color palette"""
         self.palette = palette
-        self.colors = palette.value
+        colors = self.colors = palette.value
+        # Plain attributes for hot draw paths, avoiding the get_color call
+        self.background = colors.background
+        self.surface = colors.surface
+        self.primary = colors.primary
+        self.secondary = colors.secondary
+        self.accent = colors.accent
+        self.text = colors.text
+        self.text_secondary = colors.text_secondary
+        self.border = colors.border
+        self.hover = colors.hover
+        self.disabled = colors.disabled
+
+# Fonts become invalid once pygame shuts down, so release them with it
+pygame.register_quit(UIStyle.fonts.clear)
 
 class StyleManager:
     _instance = None
@@ -81,14 +109,19 @@ class StyleManager:
         if cls._instance is None:
             cls._instance = super(StyleManager, cls).__new__(cls)
             cls._instance.current_style = UIStyle()
+            cls._instance.version = 0
         return cls._instance
     
     @classmethod
     def get_instance(cls) -> 'StyleManager':
-        return cls()
+        # Skip the __new__ round trip once the instance exists
+        instance = cls._instance
+        return instance if instance is not None else cls()
     
     def get_style(self) -> UIStyle:
         return self.current_style
     
     def set_style(self, palette: ColorPalette):
-        self.current_style.set_palette(palette) 
\ No newline at end of file
+        self.current_style.set_palette(palette)
+        # Lets components holding pre-rendered surfaces detect the change
+        self.version += 1 
\ No newline at end of file